@@ -14,19 +14,28 @@ PROJECT_ROOT = os.path.dirname(os.path.abspath(__file__))
 if PROJECT_ROOT not in sys.path:
     sys.path.insert(0, PROJECT_ROOT)
 
+from PySide6.QtCore import Qt
 from PySide6.QtWidgets import QApplication
 
 from src.application.scene_manager import SceneManager
 from src.application.slicer_service import SlicerService
 from src.infrastructure.repositories.asset_loader import AssetLoader
-from src.presentation.main_window import SlicerGUI
+from src.presentation.main_window import SlicerGUI, apply_app_stylesheet
 
 
 def main() -> None:
     # ------------------------------------------------------------------
     # 0.  Qt Application instance (required for PySide6)
     # ------------------------------------------------------------------
+    # Application attributes only take effect before QApplication exists:
+    # coalesce mouse-move / tablet floods into one event per frame and let
+    # the single app-wide stylesheet propagate fonts and palettes down the
+    # widget tree instead of being resolved per widget.
+    QApplication.setAttribute(Qt.AA_CompressHighFrequencyEvents, True)
+    QApplication.setAttribute(Qt.AA_CompressTabletEvents, True)
+    QApplication.setAttribute(Qt.AA_UseStyleSheetPropagationInWidgetStyles, True)
     app = QApplication(sys.argv)
+    apply_app_stylesheet()      # one app-wide sheet, parsed once
     # ------------------------------------------------------------------
     # 1.  Infrastructure layer  (adapters, repositories)
     # ------------------------------------------------------------------
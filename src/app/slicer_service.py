@@ -1,8 +1,19 @@
-class SlicerService:
+"""
+Legacy import path -- the service lives in src/application.
+
+``SlicerService`` here keeps the old ``SlicerService(slicer)`` /
+``run_full_process(file_path)`` API on top of the canonical service.
+"""
+from src.application.slicer_service import SlicerService as _SlicerService
+from src.domain.interfaces import SlicerInterface
+
+
+class SlicerService(_SlicerService):
     def __init__(self, slicer: SlicerInterface):
+        super().__init__(slicer)
         # The service doesn't know it's PySLM; it just knows it's a 'Slicer'
         self.slicer = slicer
 
     def run_full_process(self, file_path):
         self.slicer.slice_mesh(file_path, 0.03)
-        self.slicer.generate_hatches({"dist": 0.1, "angle": 67.0})
\ No newline at end of file
+        self.slicer.generate_hatches({"dist": 0.1, "angle": 67.0})
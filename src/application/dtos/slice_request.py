@@ -1,7 +1,9 @@
-from pydantic import BaseModel
+from dataclasses import dataclass
 from typing import Optional
 
-class SliceRequestDTO(BaseModel):
+
+@dataclass(slots=True, frozen=True)
+class SliceRequestDTO:
     """Data transfer object for starting a slicing operation."""
     stl_path: str
     layer_thickness: float
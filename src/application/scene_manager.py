@@ -8,40 +8,209 @@ from __future__ import annotations
 import json
 import math
 import uuid
-import copy
+from collections import deque
 from dataclasses import dataclass, field
-from typing import Any, Callable, Dict, List, Optional, Tuple
+from typing import TYPE_CHECKING, Any, Callable, Deque, Dict, List, Optional, Tuple, Union
 
 import numpy as np
-import trimesh
+
+if TYPE_CHECKING:  # annotations only -- trimesh is slow to import
+    import trimesh
+
+try:
+    from numba import njit
+except ImportError:  # numba is optional -- the NumPy path is used instead
+    njit = None
+
+_XYZ = np.arange(3)
+
+
+# ---------------------------------------------------------------------------
+# World-space AABB kernel
+# ---------------------------------------------------------------------------
+# An affine map sends the local box (centre c, half-extent h) to the box
+# centred on M@c + t with half-extent |M|@h, which is exactly the AABB of
+# the 8 transformed corners -- so no corners need to be materialised.
+
+def _world_aabbs_numpy(mats: np.ndarray, bounds: np.ndarray
+                       ) -> Tuple[np.ndarray, np.ndarray]:
+    """(N, 4, 4) matrices + (N, 2, 3) local bounds -> (mins, maxs), each (N, 3)."""
+    lin = mats[:, :3, :3]
+    centre = 0.5 * (bounds[:, 0] + bounds[:, 1])
+    half = 0.5 * (bounds[:, 1] - bounds[:, 0])
+    c = np.einsum("nij,nj->ni", lin, centre) + mats[:, :3, 3]
+    h = np.einsum("nij,nj->ni", np.abs(lin), half)
+    return c - h, c + h
+
+
+if njit is not None:
+    @njit(cache=True, fastmath=True)
+    def _aabb_kernel(mats, bounds, out_mins, out_maxs):
+        for n in range(mats.shape[0]):
+            for i in range(3):
+                c = mats[n, i, 3]
+                h = 0.0
+                for j in range(3):
+                    m = mats[n, i, j]
+                    c += m * 0.5 * (bounds[n, 0, j] + bounds[n, 1, j])
+                    h += abs(m) * 0.5 * (bounds[n, 1, j] - bounds[n, 0, j])
+                out_mins[n, i] = c - h
+                out_maxs[n, i] = c + h
+
+    def _world_aabbs(mats: np.ndarray, bounds: np.ndarray
+                     ) -> Tuple[np.ndarray, np.ndarray]:
+        n = mats.shape[0]
+        mins = np.empty((n, 3), dtype=np.float64)
+        maxs = np.empty((n, 3), dtype=np.float64)
+        _aabb_kernel(np.ascontiguousarray(mats, dtype=np.float64),
+                     np.ascontiguousarray(bounds, dtype=np.float64), mins, maxs)
+        return mins, maxs
+else:
+    _world_aabbs = _world_aabbs_numpy
 
 
 # ---------------------------------------------------------------------------
 # Value Objects
 # ---------------------------------------------------------------------------
-@dataclass
 class Transform:
-    """Affine transform applied to a scene object (mm / degrees)."""
-    translation: np.ndarray = field(default_factory=lambda: np.zeros(3, dtype=np.float64))
-    rotation_deg: np.ndarray = field(default_factory=lambda: np.zeros(3, dtype=np.float64))
-    scale: np.ndarray = field(default_factory=lambda: np.ones(3, dtype=np.float64))
+    """Affine transform applied to a scene object (mm / degrees).
+
+    ``origin_offset`` is a fixed local translation applied before scale and
+    rotation; SceneManager uses it to centre a mesh on its pivot without
+    rewriting the mesh vertices.  ``translation`` is where that pivot sits.
+
+    The 4x4 matrix is cached; assigning ``translation``, ``rotation_deg`` or
+    ``scale`` bumps ``_version`` and drops the cache.  Assignments copy the
+    values into the transform's own storage, which is a row of the scene's
+    ``_TransformBuffer`` once the object has been added to a SceneManager.
+    Mutate the components only through these setters -- in-place element
+    writes are not seen by the cache.
+    """
+    __slots__ = ("_translation", "_rotation_deg", "_scale", "_origin_offset",
+                 "_mat", "_version", "_buffer")
+
+    def __init__(self,
+                 translation: Optional[np.ndarray] = None,
+                 rotation_deg: Optional[np.ndarray] = None,
+                 scale: Optional[np.ndarray] = None,
+                 origin_offset: Optional[np.ndarray] = None) -> None:
+        self._translation = (np.zeros(3, dtype=np.float64) if translation is None
+                             else np.array(translation, dtype=np.float64))
+        self._rotation_deg = (np.zeros(3, dtype=np.float64) if rotation_deg is None
+                              else np.array(rotation_deg, dtype=np.float64))
+        self._scale = (np.ones(3, dtype=np.float64) if scale is None
+                       else np.array(scale, dtype=np.float64))
+        self._origin_offset = (np.zeros(3, dtype=np.float64) if origin_offset is None
+                               else np.array(origin_offset, dtype=np.float64))
+        self._mat: Optional[np.ndarray] = None
+        self._version: int = 0
+        self._buffer: Optional[_TransformBuffer] = None
+
+    def __repr__(self) -> str:
+        return (f"Transform(translation={self._translation!r}, "
+                f"rotation_deg={self._rotation_deg!r}, scale={self._scale!r})")
+
+    def __deepcopy__(self, memo: dict) -> "Transform":
+        # never drag the shared scene buffer along
+        return self.clone()
+
+    def _bump(self) -> None:
+        self._version += 1
+        self._mat = None
+        if self._buffer is not None:
+            self._buffer.version += 1
+
+    def _bind(self, buffer: "_TransformBuffer", row: int) -> None:
+        """Move storage into *row* of *buffer* (values are copied in)."""
+        buffer.trans[row] = self._translation
+        buffer.rot[row] = self._rotation_deg
+        buffer.scale[row] = self._scale
+        buffer.offset[row] = self._origin_offset
+        self._translation = buffer.trans[row]
+        self._rotation_deg = buffer.rot[row]
+        self._scale = buffer.scale[row]
+        self._origin_offset = buffer.offset[row]
+        self._buffer = buffer
+
+    def _unbind(self) -> None:
+        """Detach from the scene buffer, keeping private copies of the values."""
+        self._translation = self._translation.copy()
+        self._rotation_deg = self._rotation_deg.copy()
+        self._scale = self._scale.copy()
+        self._origin_offset = self._origin_offset.copy()
+        self._buffer = None
+
+    # ---- components --------------------------------------------------------
+    @property
+    def translation(self) -> np.ndarray:
+        return self._translation
 
-    # ---- helpers -----------------------------------------------------------
-    def to_matrix(self) -> np.ndarray:
-        """Return a 4x4 homogeneous transform matrix."""
-        rx, ry, rz = np.radians(self.rotation_deg)
-        Rx = trimesh.transformations.rotation_matrix(rx, [1, 0, 0])
-        Ry = trimesh.transformations.rotation_matrix(ry, [0, 1, 0])
-        Rz = trimesh.transformations.rotation_matrix(rz, [0, 0, 1])
-        R = Rz @ Ry @ Rx
+    @translation.setter
+    def translation(self, value: np.ndarray) -> None:
+        self._translation[:] = value
+        self._bump()
 
-        S = np.eye(4)
-        S[0, 0], S[1, 1], S[2, 2] = self.scale
+    @property
+    def rotation_deg(self) -> np.ndarray:
+        return self._rotation_deg
 
-        T = np.eye(4)
-        T[:3, 3] = self.translation
+    @rotation_deg.setter
+    def rotation_deg(self, value: np.ndarray) -> None:
+        self._rotation_deg[:] = value
+        self._bump()
 
-        return T @ R @ S
+    @property
+    def scale(self) -> np.ndarray:
+        return self._scale
+
+    @scale.setter
+    def scale(self, value: np.ndarray) -> None:
+        self._scale[:] = value
+        self._bump()
+
+    @property
+    def origin_offset(self) -> np.ndarray:
+        return self._origin_offset
+
+    @origin_offset.setter
+    def origin_offset(self, value: np.ndarray) -> None:
+        self._origin_offset[:] = value
+        self._bump()
+
+    # ---- helpers -----------------------------------------------------------
+    def to_matrix(self) -> np.ndarray:
+        """Return the (cached) 4x4 homogeneous transform matrix.
+
+        The same array object is returned until a component changes, so
+        callers must not modify it.
+        """
+        if self._mat is None:
+            self._mat = self._compute_matrix()
+        return self._mat
+
+    def _compute_matrix(self) -> np.ndarray:
+        """Build T @ Rz @ Ry @ Rx @ S @ O  (O = origin_offset translation)."""
+        rad = np.radians(self.rotation_deg)
+        cx, cy, cz = np.cos(rad)
+        sx, sy, sz = np.sin(rad)
+
+        M = np.empty((4, 4), dtype=np.float64)
+        # closed-form Rz @ Ry @ Rx
+        M[0, 0] = cz * cy
+        M[0, 1] = cz * sy * sx - sz * cx
+        M[0, 2] = cz * sy * cx + sz * sx
+        M[1, 0] = sz * cy
+        M[1, 1] = sz * sy * sx + cz * cx
+        M[1, 2] = sz * sy * cx - cz * sx
+        M[2, 0] = -sy
+        M[2, 1] = cy * sx
+        M[2, 2] = cy * cx
+        # right-multiplying by S scales the columns
+        M[:3, :3] *= self.scale
+        M[:3, 3] = self.translation + M[:3, :3] @ self.origin_offset
+        M[3, :3] = 0.0
+        M[3, 3] = 1.0
+        return M
 
     def to_dict(self) -> dict:
         """Serialise for save/load."""
@@ -49,6 +218,7 @@ class Transform:
             "translation": self.translation.tolist(),
             "rotation_deg": self.rotation_deg.tolist(),
             "scale": self.scale.tolist(),
+            "origin_offset": self.origin_offset.tolist(),
         }
 
     @classmethod
@@ -57,20 +227,36 @@ class Transform:
             translation=np.array(d["translation"], dtype=np.float64),
             rotation_deg=np.array(d["rotation_deg"], dtype=np.float64),
             scale=np.array(d["scale"], dtype=np.float64),
+            origin_offset=np.array(d.get("origin_offset", (0.0, 0.0, 0.0)),
+                                   dtype=np.float64),
         )
 
+    def pack(self) -> np.ndarray:
+        """Return ``[tx, ty, tz, rx, ry, rz, sx, sy, sz]`` as one (9,) array."""
+        return np.concatenate((self._translation, self._rotation_deg, self._scale))
+
+    def unpack(self, packed: np.ndarray) -> None:
+        """Restore translation / rotation / scale from a ``pack()`` array."""
+        self._translation[:] = packed[:3]
+        self._rotation_deg[:] = packed[3:6]
+        self._scale[:] = packed[6:9]
+        self._bump()
+
     def clone(self) -> "Transform":
-        return Transform(
-            translation=self.translation.copy(),
-            rotation_deg=self.rotation_deg.copy(),
-            scale=self.scale.copy(),
+        t = Transform(
+            translation=self._translation.copy(),
+            rotation_deg=self._rotation_deg.copy(),
+            scale=self._scale.copy(),
+            origin_offset=self._origin_offset.copy(),
         )
+        t._mat = self._mat
+        return t
 
 
 # ---------------------------------------------------------------------------
 # Scene Object  (one loaded model instance)
 # ---------------------------------------------------------------------------
-@dataclass
+@dataclass(slots=True)
 class SceneObject:
     uid: str
     name: str
@@ -79,24 +265,71 @@ class SceneObject:
     visible: bool = True
     selected: bool = False
     source_path: str = ""  # file the mesh was loaded from
+    # local-space geometry captured once (shared by duplicates of the mesh)
+    base_bounds: Optional[np.ndarray] = field(default=None, repr=False)
+    base_centroid: Optional[np.ndarray] = field(default=None, repr=False)
+    base_extents: Optional[np.ndarray] = field(default=None, repr=False)
+
+    # True while ``mesh`` may be referenced by other objects (see duplicate)
+    _mesh_shared: bool = field(default=False, init=False, repr=False)
+    # cache of the last baked mesh and the matrix it was baked with
+    _cached_matrix: Optional[np.ndarray] = field(default=None, init=False, repr=False)
+    _cached_transformed_mesh: Optional[trimesh.Trimesh] = field(
+        default=None, init=False, repr=False)
+
+    def __post_init__(self) -> None:
+        if self.base_bounds is None:
+            self.base_bounds = np.array(self.mesh.bounds, dtype=np.float64)
+        if self.base_centroid is None:
+            self.base_centroid = np.array(self.mesh.centroid, dtype=np.float64)
+        if self.base_extents is None:
+            self.base_extents = self.base_bounds[1] - self.base_bounds[0]
 
     @property
     def transformed_mesh(self) -> trimesh.Trimesh:
-        """Return a *copy* of the mesh with the transform baked in."""
-        m = self.mesh.copy()
-        m.apply_transform(self.transform.to_matrix())
-        return m
+        """Return a copy of the mesh with the transform baked in.
+
+        The copy is cached and reused until the transform changes, so
+        callers must treat the returned mesh as read-only.
+        """
+        matrix = self.transform.to_matrix()
+        if self._cached_transformed_mesh is None or matrix is not self._cached_matrix:
+            m = self.mesh.copy()
+            m.apply_transform(matrix)
+            self._cached_matrix = matrix
+            self._cached_transformed_mesh = m
+        return self._cached_transformed_mesh
+
+    def _invalidate(self) -> None:
+        """Drop the cached transformed mesh (call after mutating the transform)."""
+        self._cached_matrix = None
+        self._cached_transformed_mesh = None
+
+    def _ensure_owned_mesh(self) -> trimesh.Trimesh:
+        """Copy-on-write: give this object a private mesh before mutating it in place."""
+        if self._mesh_shared:
+            self.mesh = self.mesh.copy()
+            self._mesh_shared = False
+            self._invalidate()
+        return self.mesh
 
     @property
     def bounds_mm(self) -> np.ndarray:
-        """Axis-aligned bounding box after transform: [[min_x,y,z],[max_x,y,z]]."""
-        return self.transformed_mesh.bounds
+        """Axis-aligned bounding box after transform: [[min_x,y,z],[max_x,y,z]].
+
+        Only the local AABB is transformed, so no mesh copy is made.  The
+        result encloses the transformed mesh (it is exact for
+        translation/scale and conservative under rotation).
+        """
+        mins, maxs = _world_aabbs(self.transform.to_matrix()[None],
+                                  self.base_bounds[None])
+        return np.array([mins[0], maxs[0]])
 
 
 # ---------------------------------------------------------------------------
 # Build Plate definition
 # ---------------------------------------------------------------------------
-@dataclass
+@dataclass(slots=True)
 class BuildPlate:
     """Cylindrical SLM build plate (default: EOS M290-style 120 mm dia)."""
     diameter_mm: float = 120.0
@@ -107,73 +340,217 @@ class BuildPlate:
     def radius(self) -> float:
         return self.diameter_mm / 2.0
 
+    @property
+    def radius_sq(self) -> float:
+        r = self.diameter_mm / 2.0
+        return r * r
+
 
 # ---------------------------------------------------------------------------
 # Undo / Redo  (simple memento pattern)
 # ---------------------------------------------------------------------------
 class _UndoEntry:
-    """Snapshot of one object transform for undo/redo."""
-    __slots__ = ("uid", "label", "transform_before", "transform_after")
+    """Snapshot of one object transform for undo/redo.
+
+    ``before`` / ``after`` are packed (9,) arrays from ``Transform.pack``.
+    """
+    __slots__ = ("uid", "label", "before", "after")
 
     def __init__(self, uid: str, label: str,
-                 before: Transform, after: Transform) -> None:
+                 before: np.ndarray, after: np.ndarray) -> None:
         self.uid = uid
         self.label = label
-        self.transform_before = before
-        self.transform_after = after
+        self.before = before
+        self.after = after
+
+
+class _UndoGroupEntry:
+    """Snapshot of several object transforms changed by one action.
+
+    ``before`` / ``after`` are (K, 9) packed arrays, row i belonging to uids[i].
+    """
+    __slots__ = ("uids", "label", "before", "after")
+
+    def __init__(self, uids: List[str], label: str,
+                 before: np.ndarray, after: np.ndarray) -> None:
+        self.uids = uids
+        self.label = label
+        self.before = before
+        self.after = after
+
+
+_AnyUndoEntry = Union[_UndoEntry, _UndoGroupEntry]
 
 
 class UndoRedoManager:
-    """Linear undo/redo stack with a configurable depth limit."""
+    """Linear undo/redo stack with a configurable depth limit.
+
+    Applied entries live in a bounded deque (oldest dropped automatically);
+    undone entries move to a separate redo list that any new push clears.
+    """
 
     def __init__(self, max_depth: int = 50) -> None:
-        self._stack: List[_UndoEntry] = []
-        self._index: int = -1
+        self._stack: Deque[_AnyUndoEntry] = deque(maxlen=max_depth)
+        self._redo: List[_AnyUndoEntry] = []
         self.max_depth = max_depth
 
     # ---- public API -------------------------------------------------------
-    def push(self, entry: _UndoEntry) -> None:
+    def push(self, entry: _AnyUndoEntry) -> None:
         # discard any redo entries beyond current position
-        self._stack = self._stack[: self._index + 1]
+        self._redo.clear()
         self._stack.append(entry)
-        if len(self._stack) > self.max_depth:
-            self._stack.pop(0)
-        self._index = len(self._stack) - 1
 
     def can_undo(self) -> bool:
-        return self._index >= 0
+        return bool(self._stack)
 
     def can_redo(self) -> bool:
-        return self._index < len(self._stack) - 1
+        return bool(self._redo)
 
     @property
     def undo_label(self) -> str:
         if self.can_undo():
-            return self._stack[self._index].label
+            return self._stack[-1].label
         return ""
 
     @property
     def redo_label(self) -> str:
         if self.can_redo():
-            return self._stack[self._index + 1].label
+            return self._redo[-1].label
         return ""
 
-    def undo(self) -> Optional[_UndoEntry]:
+    def undo(self) -> Optional[_AnyUndoEntry]:
         if not self.can_undo():
             return None
-        entry = self._stack[self._index]
-        self._index -= 1
+        entry = self._stack.pop()
+        self._redo.append(entry)
         return entry
 
-    def redo(self) -> Optional[_UndoEntry]:
+    def redo(self) -> Optional[_AnyUndoEntry]:
         if not self.can_redo():
             return None
-        self._index += 1
-        return self._stack[self._index]
+        entry = self._redo.pop()
+        self._stack.append(entry)
+        return entry
 
     def clear(self) -> None:
         self._stack.clear()
-        self._index = -1
+        self._redo.clear()
+
+
+# ---------------------------------------------------------------------------
+# Transform storage  (structure of arrays)
+# ---------------------------------------------------------------------------
+class _TransformBuffer:
+    """
+    Packed (N, 3) arrays holding every scene object's transform components
+    (translation, rotation, scale and the fixed origin offset).
+
+    Row ``i`` belongs to ``uids[i]``; the bound Transform's component arrays
+    are views into that row, so batched NumPy code can read (and, followed
+    by ``touch``) write all objects in one go.  Rows are kept dense:
+    removal swaps the last row into the hole.
+    """
+
+    def __init__(self, capacity: int = 16) -> None:
+        self.trans = np.zeros((capacity, 3), dtype=np.float64)
+        self.rot = np.zeros((capacity, 3), dtype=np.float64)
+        self.scale = np.ones((capacity, 3), dtype=np.float64)
+        self.offset = np.zeros((capacity, 3), dtype=np.float64)
+        self.uids: List[str] = []
+        self.rows: Dict[str, int] = {}
+        self.transforms: List[Transform] = []
+        self.version: int = 0   # bumped whenever any bound transform changes
+        self._mats: Optional[np.ndarray] = None
+        self._mats_version: int = -1
+
+    def __len__(self) -> int:
+        return len(self.uids)
+
+    def add(self, uid: str, transform: Transform) -> None:
+        row = len(self.uids)
+        if row == self.trans.shape[0]:
+            self._grow()
+        self.uids.append(uid)
+        self.rows[uid] = row
+        self.transforms.append(transform)
+        transform._bind(self, row)
+        self.version += 1
+
+    def remove(self, uid: str) -> None:
+        row = self.rows.pop(uid)
+        self.transforms[row]._unbind()
+        last = len(self.uids) - 1
+        if row != last:
+            moved = self.transforms[last]
+            self.uids[row] = self.uids[last]
+            self.transforms[row] = moved
+            self.rows[self.uids[row]] = row
+            moved._bind(self, row)
+        self.uids.pop()
+        self.transforms.pop()
+        self.version += 1
+
+    def pack(self, rows: np.ndarray) -> np.ndarray:
+        """(K, 9) packed transforms for *rows* (same layout as ``Transform.pack``)."""
+        return np.hstack((self.trans[rows], self.rot[rows], self.scale[rows]))
+
+    def unpack(self, rows: np.ndarray, packed: np.ndarray) -> None:
+        """Write (K, 9) packed transforms back into *rows*."""
+        self.trans[rows] = packed[:, :3]
+        self.rot[rows] = packed[:, 3:6]
+        self.scale[rows] = packed[:, 6:9]
+        self.touch(rows)
+
+    def touch(self, rows) -> None:
+        """Invalidate the cached matrices of *rows* after a direct array write."""
+        for row in rows:
+            self.transforms[row]._bump()
+
+    def matrices(self) -> np.ndarray:
+        """Return (N, 4, 4) matrices T @ R @ S @ O for every row, cached on ``version``."""
+        if self._mats is not None and self._mats_version == self.version:
+            return self._mats
+        n = len(self.uids)
+        rad = np.radians(self.rot[:n])
+        cx, cy, cz = np.cos(rad).T
+        sx, sy, sz = np.sin(rad).T
+
+        R = np.zeros((n, 4, 4), dtype=np.float64)
+        R[:, 0, 0] = cz * cy
+        R[:, 0, 1] = cz * sy * sx - sz * cx
+        R[:, 0, 2] = cz * sy * cx + sz * sx
+        R[:, 1, 0] = sz * cy
+        R[:, 1, 1] = sz * sy * sx + cz * cx
+        R[:, 1, 2] = sz * sy * cx - cz * sx
+        R[:, 2, 0] = -sy
+        R[:, 2, 1] = cy * sx
+        R[:, 2, 2] = cy * cx
+        R[:, 3, 3] = 1.0
+
+        S = np.zeros((n, 4, 4), dtype=np.float64)
+        S[:, _XYZ, _XYZ] = self.scale[:n]
+        S[:, 3, 3] = 1.0
+
+        T = np.broadcast_to(np.eye(4), (n, 4, 4)).copy()
+        T[:, :3, 3] = self.trans[:n]
+
+        M = np.einsum("nij,njk->nik", T, np.einsum("nij,njk->nik", R, S))
+        M[:, :3, 3] += np.einsum("nij,nj->ni", M[:, :3, :3], self.offset[:n])
+        self._mats = M
+        self._mats_version = self.version
+        return self._mats
+
+    def _grow(self) -> None:
+        n = self.trans.shape[0]
+        cap = max(16, 2 * n)
+        for name, fill in (("trans", 0.0), ("rot", 0.0), ("scale", 1.0),
+                           ("offset", 0.0)):
+            old = getattr(self, name)
+            new = np.full((cap, 3), fill, dtype=np.float64)
+            new[:n] = old
+            setattr(self, name, new)
+        for row, t in enumerate(self.transforms):
+            t._bind(self, row)
 
 
 # ---------------------------------------------------------------------------
@@ -197,13 +574,18 @@ class SceneManager:
         self.build_plate = build_plate or BuildPlate()
         self._objects: Dict[str, SceneObject] = {}
         self._selection_uid: Optional[str] = None
+        self._xforms = _TransformBuffer()
         self.undo_redo = UndoRedoManager()
-        self._recent_files: List[str] = []
+        self._recent_files: Tuple[str, ...] = ()
+        self._objects_cache: Optional[Tuple[SceneObject, ...]] = None
 
     # ---- queries -----------------------------------------------------------
     @property
-    def objects(self) -> List[SceneObject]:
-        return list(self._objects.values())
+    def objects(self) -> Tuple[SceneObject, ...]:
+        """All objects in insertion order (cached until add / remove)."""
+        if self._objects_cache is None:
+            self._objects_cache = tuple(self._objects.values())
+        return self._objects_cache
 
     @property
     def selected_object(self) -> Optional[SceneObject]:
@@ -219,38 +601,50 @@ class SceneManager:
         return self._objects.get(uid)
 
     @property
-    def recent_files(self) -> List[str]:
-        return list(self._recent_files)
+    def recent_files(self) -> Tuple[str, ...]:
+        return self._recent_files
 
     # ---- commands ----------------------------------------------------------
     def add_mesh(self, name: str, mesh: trimesh.Trimesh,
                  source_path: str = "") -> SceneObject:
-        """Place a new mesh on the build plate (centred at origin)."""
+        """Place a new mesh on the build plate (centred at origin).
+
+        The mesh itself is left untouched; the centring is stored as the
+        transform's ``origin_offset``.
+        """
         uid = uuid.uuid4().hex[:8]
 
+        # One pass over the vertices; reused by bounds_mm / duplicate later
+        bounds = np.array(mesh.bounds, dtype=np.float64)
+        centroid = np.array(mesh.centroid, dtype=np.float64)
+
         # Auto-centre on XY, place on plate surface (Z=0)
-        centroid = mesh.centroid.copy()
-        mesh.apply_translation(-centroid)
-        z_min = mesh.bounds[0][2]
-        mesh.apply_translation([0, 0, -z_min])  # sit on Z=0
+        transform = Transform(origin_offset=[-centroid[0], -centroid[1], -bounds[0, 2]])
 
-        obj = SceneObject(uid=uid, name=name, mesh=mesh, source_path=source_path)
-        self._objects[uid] = obj
+        obj = SceneObject(uid=uid, name=name, mesh=mesh, transform=transform,
+                          source_path=source_path, base_bounds=bounds,
+                          base_centroid=centroid)
+        self._register(obj)
         self.select(uid)
 
         if source_path:
             self._add_recent(source_path)
         return obj
 
+    def _register(self, obj: SceneObject) -> None:
+        self._objects[obj.uid] = obj
+        self._xforms.add(obj.uid, obj.transform)
+        self._objects_cache = None
+
     def _add_recent(self, path: str) -> None:
-        if path in self._recent_files:
-            self._recent_files.remove(path)
-        self._recent_files.insert(0, path)
-        self._recent_files = self._recent_files[:10]
+        others = tuple(p for p in self._recent_files if p != path)
+        self._recent_files = ((path,) + others)[:10]
 
     def remove(self, uid: str) -> bool:
         if uid in self._objects:
             del self._objects[uid]
+            self._xforms.remove(uid)
+            self._objects_cache = None
             if self._selection_uid == uid:
                 self._selection_uid = None
             return True
@@ -262,16 +656,20 @@ class SceneManager:
         return False
 
     def duplicate(self, uid: str, offset: Optional[np.ndarray] = None) -> Optional[SceneObject]:
-        """Deep-copy an existing object and place it with an optional offset."""
+        """Copy an existing object and place it with an optional offset.
+
+        The mesh is shared with the source (the transform is per object);
+        code that mutates a mesh in place must call ``_ensure_owned_mesh``.
+        """
         source = self._objects.get(uid)
         if source is None:
             return None
         new_uid = uuid.uuid4().hex[:8]
-        new_mesh = source.mesh.copy()
-        new_transform = copy.deepcopy(source.transform)
+        new_mesh = source.mesh
+        new_transform = source.transform.clone()
 
         if offset is None:
-            offset = np.array([source.mesh.extents[0] * 1.2, 0.0, 0.0])
+            offset = np.array([source.base_extents[0] * 1.2, 0.0, 0.0])
         new_transform.translation = source.transform.translation + offset
 
         obj = SceneObject(
@@ -280,8 +678,12 @@ class SceneManager:
             mesh=new_mesh,
             transform=new_transform,
             source_path=source.source_path,
+            base_bounds=source.base_bounds,
+            base_centroid=source.base_centroid,
+            base_extents=source.base_extents,
         )
-        self._objects[new_uid] = obj
+        source._mesh_shared = obj._mesh_shared = True
+        self._register(obj)
         self.select(new_uid)
         return obj
 
@@ -313,7 +715,7 @@ class SceneManager:
             return
 
         if record_undo:
-            before = obj.transform.clone()
+            before = obj.transform.pack()
 
         if "translation" in kwargs:
             obj.transform.translation = np.asarray(kwargs["translation"], dtype=np.float64)
@@ -321,9 +723,10 @@ class SceneManager:
             obj.transform.rotation_deg = np.asarray(kwargs["rotation_deg"], dtype=np.float64)
         if "scale" in kwargs:
             obj.transform.scale = np.asarray(kwargs["scale"], dtype=np.float64)
+        obj._invalidate()
 
         if record_undo:
-            after = obj.transform.clone()
+            after = obj.transform.pack()
             self.undo_redo.push(_UndoEntry(uid, label, before, after))
 
     # ---- mirror ------------------------------------------------------------
@@ -334,11 +737,14 @@ class SceneManager:
         if obj is None:
             return False
 
-        before = obj.transform.clone()
+        before = obj.transform.pack()
         idx = {"x": 0, "y": 1, "z": 2}.get(axis.lower(), 0)
-        obj.transform.scale[idx] *= -1.0
+        scale = obj.transform.scale.copy()
+        scale[idx] *= -1.0
+        obj.transform.scale = scale
+        obj._invalidate()
 
-        after = obj.transform.clone()
+        after = obj.transform.pack()
         self.undo_redo.push(_UndoEntry(obj.uid, f"Mirror {axis.upper()}", before, after))
         return True
 
@@ -351,31 +757,40 @@ class SceneManager:
         return True
 
     # ---- build-volume validation -------------------------------------------
+    def _compute_all_matrices(self) -> np.ndarray:
+        """(N, 4, 4) transform matrices for every object, indexed by buffer row."""
+        return self._xforms.matrices()
+
     def check_build_volume(self) -> List[Tuple[str, str]]:
         """Return list of (uid, reason) for objects that violate the build volume."""
+        objs = [o for o in self._objects.values() if o.visible]
+        if not objs:
+            return []
+        r_sq = self.build_plate.radius_sq
+
+        # World AABBs of every object in one batched pass: (N, 3) each
+        rows = [self._xforms.rows[o.uid] for o in objs]
+        mats = self._compute_all_matrices()[rows]
+        mins, maxs = _world_aabbs(mats, np.stack([o.base_bounds for o in objs]))
+
+        # XY corners of every AABB: (N, 4, 2)
+        corners_xy = np.stack([
+            mins[:, :2],
+            np.column_stack([mins[:, 0], maxs[:, 1]]),
+            np.column_stack([maxs[:, 0], mins[:, 1]]),
+            maxs[:, :2],
+        ], axis=1)
+        sq = (corners_xy * corners_xy).sum(axis=2)
+        outside_xy = (sq > r_sq).any(axis=1)
+        below_z = mins[:, 2] < -0.01
+
         issues: List[Tuple[str, str]] = []
-        r = self.build_plate.radius
-        for obj in self._objects.values():
-            if not obj.visible:
-                continue
-            bounds = obj.bounds_mm
-            min_pt, max_pt = bounds[0], bounds[1]
-
-            # Check XY radial extent
-            corners_xy = [
-                (min_pt[0], min_pt[1]),
-                (min_pt[0], max_pt[1]),
-                (max_pt[0], min_pt[1]),
-                (max_pt[0], max_pt[1]),
-            ]
-            for cx, cy in corners_xy:
-                if math.sqrt(cx ** 2 + cy ** 2) > r:
-                    issues.append((obj.uid, f"{obj.name}: extends outside build plate radius"))
-                    break
-
-            # Check Z below plate
-            if min_pt[2] < -0.01:
-                issues.append((obj.uid, f"{obj.name}: extends below build plate (Z={min_pt[2]:.2f})"))
+        for i in np.flatnonzero(outside_xy | below_z):
+            obj = objs[i]
+            if outside_xy[i]:
+                issues.append((obj.uid, f"{obj.name}: extends outside build plate radius"))
+            if below_z[i]:
+                issues.append((obj.uid, f"{obj.name}: extends below build plate (Z={mins[i, 2]:.2f})"))
         return issues
 
     # ---- auto arrange (simple grid) ----------------------------------------
@@ -388,39 +803,49 @@ class SceneManager:
         cols = max(1, int(math.ceil(math.sqrt(n))))
         spacing = self.build_plate.radius * 0.6
 
-        for i, obj in enumerate(objs):
-            col = i % cols
-            row = i // cols
-            cx = (col - (cols - 1) / 2.0) * spacing
-            cy = (row - (n // cols - 1) / 2.0) * spacing
-            before = obj.transform.clone()
-            obj.transform.translation[0] = cx
-            obj.transform.translation[1] = cy
-            after = obj.transform.clone()
-            self.undo_redo.push(_UndoEntry(obj.uid, "Auto-arrange", before, after))
+        i = np.arange(n)
+        xs = (i % cols - (cols - 1) / 2.0) * spacing
+        ys = (i // cols - (n // cols - 1) / 2.0) * spacing
+
+        xf = self._xforms
+        rows = np.array([xf.rows[o.uid] for o in objs], dtype=np.intp)
+        before = xf.pack(rows)
+        xf.trans[rows, 0] = xs
+        xf.trans[rows, 1] = ys
+        xf.touch(rows)
+        after = xf.pack(rows)
+
+        self.undo_redo.push(_UndoGroupEntry(
+            [o.uid for o in objs], "Auto-arrange", before, after))
 
     # ---- undo / redo execution ---------------------------------------------
     def perform_undo(self) -> Optional[str]:
         entry = self.undo_redo.undo()
         if entry is None:
             return None
-        obj = self._objects.get(entry.uid)
-        if obj:
-            obj.transform.translation = entry.transform_before.translation.copy()
-            obj.transform.rotation_deg = entry.transform_before.rotation_deg.copy()
-            obj.transform.scale = entry.transform_before.scale.copy()
+        self._restore(entry, entry.before)
         return entry.label
 
     def perform_redo(self) -> Optional[str]:
         entry = self.undo_redo.redo()
         if entry is None:
             return None
+        self._restore(entry, entry.after)
+        return entry.label
+
+    def _restore(self, entry: _AnyUndoEntry, packed: np.ndarray) -> None:
+        """Write a packed snapshot back; objects deleted since are skipped."""
+        if isinstance(entry, _UndoGroupEntry):
+            rows = self._xforms.rows
+            keep = [i for i, uid in enumerate(entry.uids) if uid in rows]
+            if keep:
+                idx = np.array([rows[entry.uids[i]] for i in keep], dtype=np.intp)
+                self._xforms.unpack(idx, packed[keep])
+            return
         obj = self._objects.get(entry.uid)
         if obj:
-            obj.transform.translation = entry.transform_after.translation.copy()
-            obj.transform.rotation_deg = entry.transform_after.rotation_deg.copy()
-            obj.transform.scale = entry.transform_after.scale.copy()
-        return entry.label
+            obj.transform.unpack(packed)
+            obj._invalidate()
 
     # ---- serialisation (save / load project) --------------------------------
     def serialize(self) -> dict:
@@ -7,18 +7,36 @@ Supports:
 * Progress callback for real-time UI updates
 * Build-time estimation
 * CLI file export (Common Layer Interface)
+* Streaming slice-to-CLI export that never holds the whole build
 """
 from __future__ import annotations
 
+import hashlib
+import logging
+import multiprocessing
 import os
 import time
+from collections import OrderedDict
+from concurrent.futures import ProcessPoolExecutor
 from pathlib import Path
-from typing import Any, Callable, Dict, List, Optional
+from typing import (
+    TYPE_CHECKING, Any, Callable, Dict, Iterator, List, NamedTuple, Optional, Tuple,
+)
 
 import numpy as np
-import trimesh
 
-from src.domain.models import BuildStyle, Layer, SLMPart
+if TYPE_CHECKING:  # annotations only -- trimesh is slow to import
+    import trimesh
+
+try:
+    from numba import njit, prange
+except ImportError:  # numba is optional -- the NumPy sweep is used instead
+    njit = None
+    prange = range
+
+from src.domain.models import BuildStyle, Layer, SLMPart, make_build_style
+
+logger = logging.getLogger(__name__)
 
 
 # -----------------------------------------------------------------------
@@ -58,6 +76,336 @@ PROFILE_PRESETS: Dict[str, float] = {
 }
 
 
+# -----------------------------------------------------------------------
+#  Per-layer sectioning  (module level so worker processes can import it)
+# -----------------------------------------------------------------------
+_PARALLEL_MIN_WORK = 500_000_000  # faces x layers; below this spawning a pool costs more
+_BATCH_LAYERS = 32          # heights handed to a worker per task
+_CACHE_MIN_NS = 512_000     # only memoise batches costing > 512 us per layer
+_CACHE_MAX_MESHES = 16      # (geometry, layer thickness) entries kept, LRU
+_PROGRESS_INTERVAL_S = 0.05  # min time between per-layer progress callbacks
+
+_NEXT = np.array([1, 2, 0])  # edge i of a face runs from corner i to corner _NEXT[i]
+_BOTTOM_LIFT = 1e-6         # mm; planes at the mesh floor are cut this far above it
+
+
+def _layer_heights(z_min: float, z_max: float, layer_thickness: float) -> np.ndarray:
+    """Slice heights from *z_min* up, one per layer.
+
+    Built from an integer count rather than a float-step ``arange``; the
+    count rounds the span up (with a small tolerance, as ``arange`` does) so
+    the top partial layer is kept.
+    """
+    n_layers = max(1, int(np.ceil((z_max - z_min) / layer_thickness - 1e-9)))
+    return z_min + np.arange(n_layers, dtype=np.float64) * layer_thickness
+
+
+def _format_coords(pts: np.ndarray, fmt: str = "%.4f", point_sep: str = ",") -> str:
+    """Format an (N, D) point array with one %-format call.
+
+    Coordinates within a point are comma-separated; points are joined by
+    *point_sep* (``","`` for CLI, ``" "`` for SVG).
+    """
+    point = ",".join([fmt] * pts.shape[1])
+    return point_sep.join([point] * len(pts)) % tuple(pts.ravel().tolist())
+
+
+def _cli_header(layer_thickness: Optional[float]) -> bytearray:
+    buf = bytearray(b"$$HEADERSTART\n$$ASCII\n$$UNITS/1.0  ;; mm\n")
+    if layer_thickness is not None:
+        buf += f"$$LAYER_THICKNESS/{layer_thickness:.4f}\n".encode()
+    buf += b"$$HEADEREND\n\n"
+    return buf
+
+
+def _cli_layer(buf: bytearray, z: float, contours: List[np.ndarray]) -> None:
+    """Append one $$LAYER block with its polylines to *buf*.
+
+    Coordinates are rounded from float32, the dtype ``FlatLayerStore`` keeps,
+    so streamed and stored layers export byte-identical polylines.
+    """
+    buf += f"$$LAYER/{z:.4f}\n".encode()
+    for contour in contours:
+        if contour is not None and len(contour) > 0:
+            pts = contour[:, :2].astype(np.float32, copy=False)
+            buf += (f"$$POLYLINE/1,1,{len(contour)},"
+                    f"{_format_coords(pts, '%.4f')}\n").encode()
+
+
+def _write_all(fd: int, buf: bytearray) -> None:
+    """os.write until the whole buffer is on disk (handles partial writes)."""
+    view = memoryview(buf)
+    while view:
+        view = view[os.write(fd, view):]
+
+
+def _open_for_write(filepath: str) -> int:
+    flags = os.O_WRONLY | os.O_CREAT | os.O_TRUNC | getattr(os, "O_BINARY", 0)
+    return os.open(filepath, flags, 0o644)
+
+
+def _edge_points(vertices: np.ndarray, a: np.ndarray, b: np.ndarray,
+                 z: float) -> np.ndarray:
+    """XY where the edges (a, b) cross the plane at *z*."""
+    za, zb = vertices[a, 2], vertices[b, 2]
+    t = (z - za) / (zb - za)
+    return vertices[a, :2] + t[:, None] * (vertices[b, :2] - vertices[a, :2])
+
+
+def _trace_chains(succ: np.ndarray, has_pred: np.ndarray) -> List[List[int]]:
+    """Walk a successor map into node chains.
+
+    Open chains are started from nodes without a predecessor; whatever is
+    left is closed loops, which repeat their first node at the end.
+    """
+    nxt = succ.tolist()
+    seen = [False] * len(nxt)
+    chains: List[List[int]] = []
+    for start in np.flatnonzero(~has_pred).tolist() + list(range(len(nxt))):
+        if seen[start]:
+            continue
+        chain = [start]
+        seen[start] = True
+        node = nxt[start]
+        while node != -1 and not seen[node]:
+            chain.append(node)
+            seen[node] = True
+            node = nxt[node]
+        if node == start:
+            chain.append(start)
+        if len(chain) > 1:
+            chains.append(chain)
+    return chains
+
+
+def _stitch_segments(s_key: np.ndarray, e_key: np.ndarray,
+                     s_xy: np.ndarray, e_xy: np.ndarray) -> List[np.ndarray]:
+    """Join directed segments (start edge -> end edge) into contours.
+
+    Segment endpoints are identified by undirected edge id; each id becomes
+    one contour vertex and the segments form its successor map.
+    """
+    if len(s_key) == 0:
+        return []
+    uniq, inv = np.unique(np.concatenate([s_key, e_key]), return_inverse=True)
+    s_node, e_node = inv[:len(s_key)], inv[len(s_key):]
+
+    xy = np.empty((len(uniq), 2), dtype=np.float64)
+    xy[s_node] = s_xy
+    xy[e_node] = e_xy
+    succ = np.full(len(uniq), -1, dtype=np.intp)
+    succ[s_node] = e_node
+    has_pred = np.zeros(len(uniq), dtype=bool)
+    has_pred[e_node] = True
+
+    chains = _trace_chains(succ, has_pred)
+    if not chains:
+        return []
+    lens = np.fromiter((len(c) for c in chains), dtype=np.int64, count=len(chains))
+    flat = np.take(xy, np.concatenate(chains), axis=0)
+    return np.split(flat, np.cumsum(lens[:-1]))
+
+
+def _layer_contours(vertices: np.ndarray, tri: np.ndarray, z: float) -> List[np.ndarray]:
+    """Contours of the plane at *z* through the crossing faces *tri* (K, 3).
+
+    A vertex counts as "above" when its Z >= *z*, so every crossing face
+    has exactly one rising and one falling edge.  The segment runs from the
+    falling edge to the rising one, which makes outer loops counter-clockwise
+    and holes clockwise; a neighbouring face traverses the shared edge in the
+    opposite direction, so segments chain head to tail through edge ids
+    without any coordinate matching.
+    """
+    if len(tri) == 0:
+        return []
+    n_v = len(vertices)
+    above = vertices[tri, 2] >= z
+    nxt = tri[:, _NEXT]
+    above_nxt = above[:, _NEXT]
+    rows = np.arange(len(tri))
+    ri = (~above & above_nxt).argmax(axis=1)   # rising edge per face
+    fi = (above & ~above_nxt).argmax(axis=1)   # falling edge per face
+    sa, sb = tri[rows, fi], nxt[rows, fi]
+    ea, eb = tri[rows, ri], nxt[rows, ri]
+    return _stitch_segments(
+        np.minimum(sa, sb) * n_v + np.maximum(sa, sb),
+        np.minimum(ea, eb) * n_v + np.maximum(ea, eb),
+        _edge_points(vertices, sa, sb, z),
+        _edge_points(vertices, ea, eb, z),
+    )
+
+
+def _z_segments(vertices, faces, order, fmin_sorted, fmax, heights):
+    """Crossing segments of every height, packed by layer.
+
+    Written against plain arrays so numba can compile it; ``prange`` spreads
+    the layers over cores.  Returns (offsets, s_key, e_key, s_xy, e_xy) with
+    layer i owning rows ``offsets[i]:offsets[i + 1]``.
+    """
+    n_h = heights.shape[0]
+    n_v = vertices.shape[0]
+    ends = np.searchsorted(fmin_sorted, heights)
+    counts = np.zeros(n_h, dtype=np.int64)
+    for i in prange(n_h):
+        z = heights[i]
+        c = 0
+        for k in range(ends[i]):
+            if fmax[order[k]] >= z:
+                c += 1
+        counts[i] = c
+    offsets = np.zeros(n_h + 1, dtype=np.int64)
+    offsets[1:] = np.cumsum(counts)
+
+    total = offsets[n_h]
+    s_key = np.empty(total, dtype=np.int64)
+    e_key = np.empty(total, dtype=np.int64)
+    s_xy = np.empty((total, 2), dtype=np.float64)
+    e_xy = np.empty((total, 2), dtype=np.float64)
+    for i in prange(n_h):
+        z = heights[i]
+        w = offsets[i]
+        for k in range(ends[i]):
+            f = order[k]
+            if fmax[f] < z:
+                continue
+            for e in range(3):
+                a = faces[f, e]
+                b = faces[f, (e + 1) % 3]
+                za = vertices[a, 2]
+                zb = vertices[b, 2]
+                if (za >= z) == (zb >= z):
+                    continue
+                t = (z - za) / (zb - za)
+                x = vertices[a, 0] + t * (vertices[b, 0] - vertices[a, 0])
+                y = vertices[a, 1] + t * (vertices[b, 1] - vertices[a, 1])
+                key = min(a, b) * n_v + max(a, b)
+                if zb < z:      # falling edge starts the segment
+                    s_key[w] = key
+                    s_xy[w, 0] = x
+                    s_xy[w, 1] = y
+                else:
+                    e_key[w] = key
+                    e_xy[w, 0] = x
+                    e_xy[w, 1] = y
+            w += 1
+    return offsets, s_key, e_key, s_xy, e_xy
+
+
+if njit is not None:
+    _z_segments_parallel = njit(cache=True, parallel=True)(_z_segments)
+    _z_segments_serial = njit(cache=True)(_z_segments)
+
+
+def _fast_z_slice(vertices: np.ndarray, faces: np.ndarray,
+                  heights: np.ndarray, parallel: bool = True) -> List[List[np.ndarray]]:
+    """Slice a triangle mesh with horizontal planes; one contour list per height.
+
+    Per-face Z extents are computed once and the faces are sorted by their
+    lowest Z.  Heights are then visited bottom-up while a rolling set of
+    active faces is maintained: faces are admitted once the plane passes
+    their lowest Z and retired once it passes their highest, so each layer
+    only touches the faces that can actually cross it.
+
+    A plane at (or below) the mesh floor would only touch the coplanar
+    bottom faces and yield nothing, so it is cut ``_BOTTOM_LIFT`` above the
+    floor instead; flat-bottomed parts keep their first layer.
+
+    With numba installed the segment extraction for all heights runs in
+    one compiled kernel (multi-threaded over layers unless *parallel* is
+    False); only the stitching stays in Python.
+    """
+    vertices = np.asarray(vertices, dtype=np.float64)
+    faces = np.asarray(faces, dtype=np.int64)
+    heights = np.asarray(heights, dtype=np.float64)
+    fz = vertices[:, 2][faces]
+    fmin, fmax = fz.min(axis=1), fz.max(axis=1)
+    order = np.argsort(fmin, kind="stable")
+    fmin_sorted = fmin[order]
+    if len(fmin_sorted):
+        heights = np.maximum(heights, fmin_sorted[0] + _BOTTOM_LIFT)
+
+    if njit is not None:
+        kernel = _z_segments_parallel if parallel else _z_segments_serial
+        offsets, s_key, e_key, s_xy, e_xy = kernel(
+            vertices, faces, order, fmin_sorted, fmax, heights)
+        return [_stitch_segments(s_key[a:b], e_key[a:b], s_xy[a:b], e_xy[a:b])
+                for a, b in zip(offsets[:-1], offsets[1:])]
+
+    result: List[List[np.ndarray]] = [[] for _ in range(len(heights))]
+    active = np.empty(0, dtype=order.dtype)
+    admitted = 0
+    for hi in np.argsort(heights, kind="stable"):
+        z = float(heights[hi])
+        # admit faces with fmin < z, retire those with fmax < z
+        end = int(np.searchsorted(fmin_sorted, z, side="left"))
+        if end > admitted:
+            active = np.concatenate([active, order[admitted:end]])
+            admitted = end
+        active = active[fmax[active] >= z]
+        result[hi] = _layer_contours(vertices, faces[active], z)
+    return result
+
+
+def _mesh_key(vertices: np.ndarray, faces: np.ndarray) -> bytes:
+    """Content digest of a mesh's geometry (stable across copies / reloads)."""
+    h = hashlib.blake2b(digest_size=16)
+    h.update(vertices)
+    h.update(faces)
+    return h.digest()
+
+
+def _slice_batch(vertices: np.ndarray, faces: np.ndarray, heights: np.ndarray,
+                 parallel: bool = True) -> Tuple[List[List[np.ndarray]], int]:
+    """Slice a batch of heights and report the wall time it took (ns).
+
+    Pool workers pass ``parallel=False`` so numba threads don't oversubscribe
+    the cores the pool already uses.
+    """
+    t0 = time.perf_counter_ns()
+    contours = _fast_z_slice(vertices, faces, heights, parallel)
+    return contours, time.perf_counter_ns() - t0
+
+
+_worker_meshes: Dict[int, Tuple[np.ndarray, np.ndarray]] = {}
+
+
+def _init_worker(meshes: Dict[int, Tuple[np.ndarray, np.ndarray]]) -> None:
+    """Pool initializer: receive the pooled meshes once per worker process."""
+    global _worker_meshes
+    _worker_meshes = meshes
+
+
+def _slice_worker_batch(mi: int, heights: np.ndarray
+                        ) -> Tuple[List[List[np.ndarray]], int]:
+    """Process-pool entry point: slice *heights* of the worker's mesh *mi*."""
+    vertices, faces = _worker_meshes[mi]
+    return _slice_batch(vertices, faces, heights, parallel=False)
+
+
+class _Sections(NamedTuple):
+    """One part's geometry, section memo and height batches."""
+    vertices: np.ndarray
+    faces: np.ndarray
+    memo: Dict[tuple, Any]
+    batches: List[np.ndarray]
+    keys: List[tuple]
+
+    def missing(self) -> List[int]:
+        """Indices of the batches not in the memo."""
+        return [i for i, k in enumerate(self.keys) if k not in self.memo]
+
+    def wants_pool(self) -> bool:
+        """Worth a process pool: no numba, several cores and enough work.
+
+        The numba kernel already spreads layers over every core, so the
+        pool is only for the NumPy sweep.
+        """
+        if njit is not None or (os.cpu_count() or 1) <= 1:
+            return False
+        layers = sum(len(self.batches[i]) for i in self.missing())
+        return len(self.faces) * layers >= _PARALLEL_MIN_WORK
+
+
 class SlicerService:
     """
     High-level service consumed by the Presentation layer.
@@ -73,6 +421,12 @@ class SlicerService:
         self._adapter = slicer_adapter
         self.last_result: Optional[Dict[str, Any]] = None
         self.last_parts: List[SLMPart] = []
+        # (geometry digest, layer thickness) -> {(z0, n): contours}, LRU order
+        self._section_cache: OrderedDict[Tuple[bytes, float], Dict[tuple, Any]] = OrderedDict()
+
+    def invalidate(self) -> None:
+        """Forget all memoised sections (frees their memory)."""
+        self._section_cache.clear()
 
     # ------------------------------------------------------------------
     #  Main entry point called by the GUI
@@ -98,88 +452,31 @@ class SlicerService:
         -------
         dict   summary with total_layers, per-part info, elapsed time, etc.
         """
-        def _progress(val: float, msg: str = "") -> None:
-            if progress_cb:
-                try:
-                    progress_cb(val, msg)
-                except Exception:
-                    pass
-
+        _progress = self._progress_fn(progress_cb)
         t0 = time.perf_counter()
 
-        style = BuildStyle(
-            name="GUI_Style",
-            layer_thickness=params.get("layer_thickness", 0.03),
-            laser_power=params.get("laser_power", 200.0),
-            scan_speed=params.get("scan_speed", 1000.0),
-            hatch_spacing=params.get("hatch_spacing", 0.10),
-            hatch_angle_increment=params.get("hatch_angle_increment", 67.0),
-        )
+        style = self._build_style(params)
+        plan = self._plan(mesh_items, style.layer_thickness)
+        all_parts = [SLMPart(name=item["name"], mesh_data=item["mesh"])
+                     for item in mesh_items]
+
+        for mi, batch_heights, batch_contours in self._iter_batches(
+                mesh_items, plan, style.layer_thickness, _progress):
+            store = all_parts[mi].layers
+            for z, contours in zip(batch_heights, batch_contours):
+                store.append_layer(float(z), contours)
 
         total_layers = 0
-        total_z_expected = 0
         part_summaries: List[dict] = []
-        all_parts: List[SLMPart] = []
-
-        # Pre-calculate total expected layers for progress
-        for item in mesh_items:
-            mesh: trimesh.Trimesh = item["mesh"]
-            z_min, z_max = mesh.bounds[0][2], mesh.bounds[1][2]
-            total_z_expected += max(1, int((z_max - z_min) / style.layer_thickness))
-
-        processed_layers = 0
-        _progress(0.0, "Starting slice...")
-
-        for mi, item in enumerate(mesh_items):
-            mesh: trimesh.Trimesh = item["mesh"]
-            name: str = item["name"]
-
-            part = SLMPart(name=name, mesh_data=mesh)
-
-            # Compute Z range
-            z_min, z_max = mesh.bounds[0][2], mesh.bounds[1][2]
-            heights = np.arange(z_min, z_max, style.layer_thickness)
-
-            _progress(
-                processed_layers / max(1, total_z_expected),
-                f"Slicing {name}... ({mi + 1}/{len(mesh_items)})",
-            )
-
-            for zi, z in enumerate(heights):
-                try:
-                    section = mesh.section(
-                        plane_origin=[0, 0, z],
-                        plane_normal=[0, 0, 1],
-                    )
-                    contours = []
-                    if section is not None:
-                        path_2d, _ = section.to_planar()
-                        for entity in path_2d.entities:
-                            pts = path_2d.vertices[entity.points]
-                            contours.append(pts)
-                except Exception:
-                    contours = []
-
-                layer = Layer(z_height=float(z), contours=contours)
-                part.add_layer(layer)
-
-                processed_layers += 1
-                if zi % 20 == 0:
-                    _progress(
-                        processed_layers / max(1, total_z_expected),
-                        f"Slicing {name}: layer {zi + 1}/{len(heights)}",
-                    )
-
+        for part, (z_min, z_max, _) in zip(all_parts, plan):
             total_layers += len(part.layers)
-            all_parts.append(part)
             part_summaries.append({
-                "name": name,
+                "name": part.name,
                 "layers": len(part.layers),
                 "z_range": (float(z_min), float(z_max)),
             })
-
             print(
-                f"[SlicerService] {name}: {len(part.layers)} layers  "
+                f"[SlicerService] {part.name}: {len(part.layers)} layers  "
                 f"(Z {z_min:.3f} -> {z_max:.3f} mm)"
             )
 
@@ -198,6 +495,184 @@ class SlicerService:
         }
         return self.last_result
 
+    def iter_slice(
+        self,
+        mesh_items: List[dict],
+        params: dict,
+        progress_cb: Optional[Callable[[float, str], None]] = None,
+    ) -> Iterator[Tuple[str, Layer]]:
+        """Yield ``(part_name, Layer)`` in build order as each layer is sliced.
+
+        Nothing is retained, so peak memory is one batch of layers rather
+        than the whole build; ``last_parts`` / ``last_result`` are untouched.
+        """
+        style = self._build_style(params)
+        plan = self._plan(mesh_items, style.layer_thickness)
+        for mi, batch_heights, batch_contours in self._iter_batches(
+                mesh_items, plan, style.layer_thickness,
+                self._progress_fn(progress_cb)):
+            name = mesh_items[mi]["name"]
+            for z, contours in zip(batch_heights, batch_contours):
+                yield name, Layer(z_height=float(z), contours=contours)
+
+    # ------------------------------------------------------------------
+    #  Slicing internals
+    # ------------------------------------------------------------------
+    @staticmethod
+    def _progress_fn(progress_cb: Optional[Callable[[float, str], None]]
+                     ) -> Callable[..., None]:
+        def _progress(val: float, msg: str = "") -> None:
+            if progress_cb:
+                try:
+                    progress_cb(val, msg)
+                except Exception:
+                    pass
+        return _progress
+
+    @staticmethod
+    def _build_style(params: dict) -> BuildStyle:
+        return make_build_style(
+            name="GUI_Style",
+            layer_thickness=float(params.get("layer_thickness", 0.03)),
+            laser_power=float(params.get("laser_power", 200.0)),
+            scan_speed=float(params.get("scan_speed", 1000.0)),
+            hatch_spacing=float(params.get("hatch_spacing", 0.10)),
+            hatch_angle_increment=float(params.get("hatch_angle_increment", 67.0)),
+        )
+
+    @staticmethod
+    def _plan(mesh_items: List[dict], layer_thickness: float
+              ) -> List[Tuple[float, float, np.ndarray]]:
+        """(z_min, z_max, heights) per item; mesh.bounds is read once here."""
+        plan = []
+        for item in mesh_items:
+            bounds = item["mesh"].bounds
+            z_min, z_max = float(bounds[0][2]), float(bounds[1][2])
+            plan.append((z_min, z_max, _layer_heights(z_min, z_max, layer_thickness)))
+        return plan
+
+    def _iter_batches(
+        self,
+        mesh_items: List[dict],
+        plan: List[Tuple[float, float, np.ndarray]],
+        layer_thickness: float,
+        _progress: Callable[..., None],
+    ) -> Iterator[Tuple[int, np.ndarray, List[List[np.ndarray]]]]:
+        """Yield (item index, heights, contours) batches across the whole plate.
+
+        Owns progress reporting and the process pool: at most one per call,
+        created only if some part wants it and shut down even if the
+        consumer stops early.  Workers are spawned rather than forked (this
+        may run on a Qt thread) and receive the pooled meshes once, via the
+        pool initializer.
+        """
+        total_z_expected = sum(len(h) for _, _, h in plan)
+        processed_layers = 0
+        _progress(0.0, "Starting slice...")
+        last_cb = time.perf_counter()
+
+        sections = [self._sections(item["mesh"], heights, layer_thickness)
+                    for item, (_, _, heights) in zip(mesh_items, plan)]
+        pooled = {mi: (sec.vertices, sec.faces)
+                  for mi, sec in enumerate(sections) if sec.wants_pool()}
+        executor: Optional[ProcessPoolExecutor] = None
+
+        try:
+            if pooled:
+                executor = ProcessPoolExecutor(
+                    mp_context=multiprocessing.get_context("spawn"),
+                    initializer=_init_worker,
+                    initargs=(pooled,),
+                )
+            for mi, item in enumerate(mesh_items):
+                name: str = item["name"]
+                heights = plan[mi][2]
+                _progress(
+                    processed_layers / max(1, total_z_expected),
+                    f"Slicing {name}... ({mi + 1}/{len(mesh_items)})",
+                )
+
+                done = 0
+                for batch_heights, batch_contours in self._iter_sections(
+                        mi, sections[mi], executor if mi in pooled else None):
+                    yield mi, batch_heights, batch_contours
+                    done += len(batch_heights)
+                    processed_layers += len(batch_heights)
+                    now = time.perf_counter()
+                    if now - last_cb > _PROGRESS_INTERVAL_S or done == len(heights):
+                        last_cb = now
+                        _progress(
+                            processed_layers / max(1, total_z_expected),
+                            f"Slicing {name}: layer {done}/{len(heights)}",
+                        )
+        finally:
+            if executor is not None:
+                executor.shutdown(cancel_futures=True)
+
+    def _mesh_sections(self, vertices: np.ndarray, faces: np.ndarray,
+                       layer_thickness: float) -> Dict[tuple, Any]:
+        """Section memo for this geometry and layer thickness.
+
+        Keyed by content rather than object identity, so a re-collected or
+        reloaded but unchanged mesh hits, while any edit to it misses.
+        """
+        key = (_mesh_key(vertices, faces), round(layer_thickness, 6))
+        cache = self._section_cache
+        memo = cache.get(key)
+        if memo is None:
+            memo = cache[key] = {}
+            while len(cache) > _CACHE_MAX_MESHES:
+                cache.popitem(last=False)
+        else:
+            cache.move_to_end(key)
+        return memo
+
+    def _sections(self, mesh: trimesh.Trimesh, heights: np.ndarray,
+                  layer_thickness: float) -> _Sections:
+        """Split *heights* into ``_BATCH_LAYERS`` batches keyed for the memo."""
+        vertices = np.ascontiguousarray(mesh.vertices)
+        faces = np.ascontiguousarray(mesh.faces)
+        batches = [heights[i:i + _BATCH_LAYERS]
+                   for i in range(0, len(heights), _BATCH_LAYERS)]
+        return _Sections(
+            vertices, faces,
+            self._mesh_sections(vertices, faces, layer_thickness),
+            batches,
+            [(round(float(b[0]), 6), len(b)) for b in batches],
+        )
+
+    @staticmethod
+    def _iter_sections(
+        mi: int,
+        sections: _Sections,
+        executor: Optional[ProcessPoolExecutor],
+    ) -> Iterator[Tuple[np.ndarray, List[List[np.ndarray]]]]:
+        """Yield (heights, contours) per batch of ``_BATCH_LAYERS``, in Z order.
+
+        Batches already sliced for this mesh and layer thickness come from
+        the memo; the rest are sliced on *executor* (which holds mesh *mi*)
+        if one is given, else in-process.
+        """
+        vertices, faces, memo, batches, keys = sections
+        todo = sections.missing()
+
+        if executor is not None and todo:
+            computed = executor.map(_slice_worker_batch, [mi] * len(todo),
+                                    [batches[i] for i in todo])
+        else:
+            computed = (_slice_batch(vertices, faces, batches[i]) for i in todo)
+        computed = iter(computed)
+
+        todo_set = set(todo)
+        for i, (batch, key) in enumerate(zip(batches, keys)):
+            if i in todo_set:
+                contours, elapsed_ns = next(computed)
+                if elapsed_ns > _CACHE_MIN_NS * len(batch):
+                    memo[key] = contours
+            else:
+                contours = memo[key]
+            yield batch, contours
+
     # =====================================================================
     #  Build time estimation  (simplified model)
     # =====================================================================
@@ -221,11 +696,11 @@ class SlicerService:
 
         total_area_mm2 = 0.0
         if meshes:
-            for item in meshes:
-                mesh = item.get("mesh")
-                if mesh is not None:
-                    ext = mesh.extents
-                    total_area_mm2 += ext[0] * ext[1]
+            exts = [item["mesh"].extents[:2] for item in meshes
+                    if item.get("mesh") is not None]
+            if exts:
+                xy = np.asarray(exts, dtype=np.float64)
+                total_area_mm2 = float(np.dot(xy[:, 0], xy[:, 1]))
         else:
             total_area_mm2 = 2500.0
 
@@ -248,30 +723,65 @@ class SlicerService:
             raise RuntimeError("No slice data — run slice() first.")
 
         written = 0
-        with open(filepath, "w") as f:
-            f.write("$$HEADERSTART\n")
-            f.write("$$ASCII\n")
-            f.write("$$UNITS/1.0  ;; mm\n")
-            if self.last_result:
-                lt = self.last_result.get("layer_thickness", 0.030)
-                f.write(f"$$LAYER_THICKNESS/{lt:.4f}\n")
-            f.write("$$HEADEREND\n\n")
-
-            for part in self.last_parts:
-                f.write(f";; Part: {part.name}\n")
-                for layer in part.layers:
-                    f.write(f"$$LAYER/{layer.z_height:.4f}\n")
-                    for contour in layer.contours:
-                        if contour is not None and len(contour) > 0:
-                            pts = contour.flatten()
-                            coord_str = ",".join(f"{v:.4f}" for v in pts)
-                            f.write(f"$$POLYLINE/1,1,{len(contour)},{coord_str}\n")
-                    written += 1
-            f.write("$$END\n")
+        lt = self.last_result.get("layer_thickness", 0.030) if self.last_result else None
+        buf = _cli_header(lt)
+
+        for part in self.last_parts:
+            store = part.layers
+            buf += f";; Part: {part.name}\n".encode()
+            for li, z in enumerate(store.z_heights):
+                _cli_layer(buf, z, store.layer_contours(li))
+                written += 1
+        buf += b"$$END\n"
+
+        # whole file in one buffer -> as few write syscalls as the OS allows
+        fd = _open_for_write(filepath)
+        try:
+            _write_all(fd, buf)
+        finally:
+            os.close(fd)
 
         print(f"[SlicerService] Exported {written} layers to {filepath}")
         return written
 
+    def export_cli_streaming(
+        self,
+        filepath: str,
+        mesh_items: List[dict],
+        params: dict,
+        progress_cb: Optional[Callable[[float, str], None]] = None,
+    ) -> int:
+        """Slice *mesh_items* straight into a CLI file, one batch at a time.
+
+        Unlike ``slice`` + ``export_cli`` no layers are kept in memory, so
+        arbitrarily deep builds can be written.  Returns the layer count.
+        """
+        style = self._build_style(params)
+        plan = self._plan(mesh_items, style.layer_thickness)
+
+        written = 0
+        current = -1
+        fd = _open_for_write(filepath)
+        try:
+            _write_all(fd, _cli_header(style.layer_thickness))
+            for mi, batch_heights, batch_contours in self._iter_batches(
+                    mesh_items, plan, style.layer_thickness,
+                    self._progress_fn(progress_cb)):
+                buf = bytearray()
+                if mi != current:
+                    current = mi
+                    buf += f";; Part: {mesh_items[mi]['name']}\n".encode()
+                for z, contours in zip(batch_heights, batch_contours):
+                    _cli_layer(buf, float(z), contours)
+                    written += 1
+                _write_all(fd, buf)
+            _write_all(fd, bytearray(b"$$END\n"))
+        finally:
+            os.close(fd)
+
+        logger.info("Streamed %d layers to %s", written, filepath)
+        return written
+
     # =====================================================================
     #  Export  (SVG layer preview — single layer)
     # =====================================================================
@@ -281,34 +791,41 @@ class SlicerService:
             return False
 
         contours = []
+        blocks = []
         for part in self.last_parts:
             if layer_index < len(part.layers):
-                contours.extend(part.layers[layer_index].contours)
+                contours.extend(part.layers.layer_contours(layer_index))
+                blocks.append(part.layers.layer_vertices(layer_index))
 
         if not contours:
             return False
 
-        all_pts_list = [c for c in contours if c is not None and len(c) > 0]
-        if not all_pts_list:
+        # each part's layer is one contiguous block: reduce the blocks in
+        # place instead of copying them into one array first
+        blocks = [b for b in blocks if len(b)]
+        if not blocks:
             return False
-        all_pts = np.vstack(all_pts_list)
-        x_min, y_min = all_pts.min(axis=0)[:2]
-        x_max, y_max = all_pts.max(axis=0)[:2]
+        lo = np.min([b.min(axis=0) for b in blocks], axis=0).astype(np.float64)
+        hi = np.max([b.max(axis=0) for b in blocks], axis=0).astype(np.float64)
+        x_min, y_min = lo
         margin = 2.0
-        w = x_max - x_min + 2 * margin
-        h = y_max - y_min + 2 * margin
+        w, h = hi - lo + 2 * margin
+
+        lines = [
+            f'<svg xmlns="http://www.w3.org/2000/svg" '
+            f'viewBox="{x_min - margin} {y_min - margin} {w} {h}" '
+            f'width="{w * 3}" height="{h * 3}">',
+            f'  <rect x="{x_min - margin}" y="{y_min - margin}" '
+            f'width="{w}" height="{h}" fill="#f8f8f8"/>',
+        ]
+        lines.extend(
+            f'  <polyline points="{_format_coords(contour[:, :2], "%.3f", " ")}" '
+            f'fill="none" stroke="#196EF0" stroke-width="0.15"/>'
+            for contour in contours
+            if contour is not None and len(contour) >= 2
+        )
+        lines.append("</svg>\n")
 
         with open(filepath, "w") as f:
-            f.write(f'<svg xmlns="http://www.w3.org/2000/svg" '
-                    f'viewBox="{x_min - margin} {y_min - margin} {w} {h}" '
-                    f'width="{w * 3}" height="{h * 3}">\n')
-            f.write(f'  <rect x="{x_min - margin}" y="{y_min - margin}" '
-                    f'width="{w}" height="{h}" fill="#f8f8f8"/>\n')
-            for contour in contours:
-                if contour is None or len(contour) < 2:
-                    continue
-                pts = " ".join(f"{p[0]:.3f},{p[1]:.3f}" for p in contour)
-                f.write(f'  <polyline points="{pts}" '
-                        f'fill="none" stroke="#196EF0" stroke-width="0.15"/>\n')
-            f.write("</svg>\n")
+            f.write("\n".join(lines))
         return True
@@ -1,5 +1,5 @@
-from src.app.dtos.slice_request import SliceRequestDTO
-from src.domain.models import SLMPart, BuildStyle
+from src.application.dtos.slice_request import SliceRequestDTO
+from src.domain.models import SLMPart, make_build_style
 
 class SlicePartUseCase:
     """Application service to orchestrate the slicing process."""
@@ -14,7 +14,7 @@ class SlicePartUseCase:
         
         # 2. Create Domain Entity
         part = SLMPart(name=request.stl_path, mesh_data=mesh)
-        style = BuildStyle(
+        style = make_build_style(
             name="Default",
             layer_thickness=request.layer_thickness,
             laser_power=request.laser_power,
@@ -1,22 +1,23 @@
 from dataclasses import dataclass, field
-from typing import List, Optional
+from functools import lru_cache
+from typing import Any, Iterator, List, Optional, Sequence
 import numpy as np
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class HatchPath:
     """Represents a set of scan vectors for a single hatch region."""
     points: np.ndarray  # Shape (N, 2, 2) or similar for scan lines
     laser_power: float
     scan_speed: float
 
-@dataclass
+@dataclass(slots=True)
 class Layer:
     """A single discrete slice of the 3D part."""
     z_height: float
     contours: List[np.ndarray] = field(default_factory=list)
     hatches: List[HatchPath] = field(default_factory=list)
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class BuildStyle:
     """Domain entity representing the process parameters for SLM."""
     name: str
@@ -26,13 +27,121 @@ class BuildStyle:
     hatch_spacing: float    # mm
     hatch_angle_increment: float # degrees
 
+@lru_cache(maxsize=128)
+def make_build_style(name: str, layer_thickness: float, laser_power: float,
+                     scan_speed: float, hatch_spacing: float,
+                     hatch_angle_increment: float) -> BuildStyle:
+    """Shared, interned BuildStyle for a given parameter set."""
+    return BuildStyle(name, layer_thickness, laser_power, scan_speed,
+                      hatch_spacing, hatch_angle_increment)
+
+def _grow(buf: np.ndarray, needed: int) -> np.ndarray:
+    """Return *buf* or a copy with capacity >= *needed* rows (doubling)."""
+    if needed <= len(buf):
+        return buf
+    cap = max(16, len(buf))
+    while cap < needed:
+        cap *= 2
+    out = np.empty((cap,) + buf.shape[1:], dtype=buf.dtype)
+    out[:len(buf)] = buf
+    return out
+
+class FlatLayerStore:
+    """Structure-of-arrays storage for the layers of one part.
+
+    Every contour vertex lives in a single (N, 2) float32 array -- plenty
+    for micrometre resolution on a build plate a few hundred mm across.
+    ``contour_offsets`` delimits the contours inside it and
+    ``layer_contour_offsets`` delimits the contours of each layer, so
+    exporters can walk flat arrays instead of per-layer Python lists.  Indexing / iterating still yields ``Layer``
+    objects whose contours are views into the shared buffer.
+    """
+    __slots__ = ("_z", "_verts", "_contour_off", "_layer_off",
+                 "_n_layers", "_n_contours", "_n_verts")
+
+    def __init__(self) -> None:
+        self._z = np.empty(16, dtype=np.float64)
+        self._verts = np.empty((16, 2), dtype=np.float32)
+        self._contour_off = np.zeros(16, dtype=np.intp)
+        self._layer_off = np.zeros(16, dtype=np.intp)
+        self._n_layers = 0
+        self._n_contours = 0
+        self._n_verts = 0
+
+    # ---- flat views ----------------------------------------------------
+    @property
+    def z_heights(self) -> np.ndarray:
+        return self._z[:self._n_layers]
+
+    @property
+    def contour_vertices(self) -> np.ndarray:
+        return self._verts[:self._n_verts]
+
+    @property
+    def contour_offsets(self) -> np.ndarray:
+        """(num_contours + 1,) start of each contour in ``contour_vertices``."""
+        return self._contour_off[:self._n_contours + 1]
+
+    @property
+    def layer_contour_offsets(self) -> np.ndarray:
+        """(num_layers + 1,) first contour index of each layer."""
+        return self._layer_off[:self._n_layers + 1]
+
+    # ---- building ------------------------------------------------------
+    def append_layer(self, z_height: float, contours: Sequence[np.ndarray]) -> None:
+        pts = [np.asarray(c)[:, :2] for c in contours if c is not None]
+        n_new = sum(len(c) for c in pts)
+        nl, nc, nv = self._n_layers, self._n_contours, self._n_verts
+
+        self._z = _grow(self._z, nl + 1)
+        self._layer_off = _grow(self._layer_off, nl + 2)
+        self._contour_off = _grow(self._contour_off, nc + len(pts) + 1)
+        self._verts = _grow(self._verts, nv + n_new)
+
+        self._z[nl] = z_height
+        if pts:
+            self._verts[nv:nv + n_new] = np.concatenate(pts)
+            self._contour_off[nc + 1:nc + len(pts) + 1] = (
+                nv + np.cumsum([len(c) for c in pts]))
+        self._n_layers = nl + 1
+        self._n_contours = nc + len(pts)
+        self._n_verts = nv + n_new
+        self._layer_off[self._n_layers] = self._n_contours
+
+    # ---- reading -------------------------------------------------------
+    def layer_contours(self, index: int) -> List[np.ndarray]:
+        """Contours of layer *index* as views into ``contour_vertices``."""
+        off = self._contour_off
+        c0, c1 = self._layer_off[index], self._layer_off[index + 1]
+        return [self._verts[off[c]:off[c + 1]] for c in range(c0, c1)]
+
+    def layer_vertices(self, index: int) -> np.ndarray:
+        """All vertices of layer *index* as one contiguous (M, 2) view."""
+        c0, c1 = self._layer_off[index], self._layer_off[index + 1]
+        return self._verts[self._contour_off[c0]:self._contour_off[c1]]
+
+    def __len__(self) -> int:
+        return self._n_layers
+
+    def __getitem__(self, index: int) -> Layer:
+        if index < 0:
+            index += self._n_layers
+        if not 0 <= index < self._n_layers:
+            raise IndexError("layer index out of range")
+        return Layer(z_height=float(self._z[index]),
+                     contours=self.layer_contours(index))
+
+    def __iter__(self) -> Iterator[Layer]:
+        for i in range(self._n_layers):
+            yield self[i]
+
+@dataclass(slots=True, eq=False)
 class SLMPart:
     """Root aggregate for a part being sliced."""
-    def __init__(self, name: str, mesh_data):
-        self.name = name
-        self.mesh_data = mesh_data
-        self.layers: List[Layer] = []
-        self.metadata: dict = {}
+    name: str
+    mesh_data: Any
+    layers: FlatLayerStore = field(default_factory=FlatLayerStore)
+    metadata: dict = field(default_factory=dict)
 
     def add_layer(self, layer: Layer):
-        self.layers.append(layer)
+        self.layers.append_layer(layer.z_height, layer.contours)
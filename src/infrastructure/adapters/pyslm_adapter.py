@@ -1,3 +1,5 @@
+import logging
+
 try:
     import pyslm
 except ModuleNotFoundError as exc:
@@ -7,12 +9,32 @@ except ModuleNotFoundError as exc:
 from src.domain.interfaces import SlicerInterface
 from src.domain.models import SLMPart, BuildStyle
 
+logger = logging.getLogger(__name__)
+
+
 class PySLMAdapter(SlicerInterface):
     """
     Adapter for the PySLM library.
     Encapsulates the complexity of PySLM's slicing and hatching algorithms.
     """
-    
+
+    def __init__(self):
+        self.stack = None
+
+    def slice_mesh(self, stl_path: str, layer_height: float):
+        # Translate the request into PySLM logic
+        part = pyslm.Part(stl_path)
+        self.stack = pyslm.Stack(part)
+        self.stack.slice(layerHeight=layer_height)
+        logger.debug("PySLM sliced %s at %smm", stl_path, layer_height)
+
+    def generate_hatches(self, settings: dict):
+        if self.stack:
+            self.stack.generateHatches(
+                hatchDistance=settings.get("dist", 0.1),
+                hatchAngle=settings.get("angle", 67.0)
+            )
+
     def generate_toolpath(self, part: SLMPart, style: BuildStyle):
         """
         Implementation of the slicing process using PySLM.
@@ -33,5 +55,5 @@ class PySLMAdapter(SlicerInterface):
         # This is where PySLM's power comes in
         # stack.generate_hatches(hatch_spacing=style.hatch_spacing, angle=style.hatch_angle_increment)
         
-        print(f"Successfully generated toolpath for {part.name} using PySLM")
+        logger.debug("Generated toolpath for %s using PySLM", part.name)
         return stack
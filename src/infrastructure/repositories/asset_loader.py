@@ -7,6 +7,7 @@ on file-format details.
 from __future__ import annotations
 
 import os
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
 from pathlib import Path
 from typing import List, Optional, Tuple
 
@@ -15,6 +16,12 @@ import trimesh
 # Supported extensions (lower-case, with dot)
 SUPPORTED_EXTENSIONS = {".stl", ".3mf", ".obj", ".amf"}
 
+# load_many concurrency: threads overlap file reads; big XML-based formats
+# are parsed in worker processes since that parsing holds the GIL.
+_MAX_LOAD_WORKERS = 8
+_PROCESS_PARSE_EXTENSIONS = {".3mf", ".amf"}
+_PROCESS_PARSE_MIN_BYTES = 16 * 1024 * 1024
+
 
 class AssetLoadError(Exception):
     """Raised when an asset cannot be loaded or parsed."""
@@ -29,10 +36,13 @@ class AssetLoader:
     # ------------------------------------------------------------------
     # public API
     # ------------------------------------------------------------------
-    def load(self, file_path: str) -> Tuple[str, trimesh.Trimesh]:
+    def load(self, file_path: str, auto_repair: bool = True) -> Tuple[str, trimesh.Trimesh]:
         """
         Load a mesh file and return (display_name, trimesh.Trimesh).
 
+        With *auto_repair* close vertices are merged and normals made
+        consistent; pass False to keep the mesh exactly as stored.
+
         Raises
         ------
         AssetLoadError  if the file is missing, unsupported, or corrupt.
@@ -48,16 +58,33 @@ class AssetLoader:
         # trimesh.load may return a Scene for multi-body files (3MF, AMF).
         mesh = self._ensure_single_mesh(loaded, path.name)
 
-        # Repair: merge close vertices, fix normals
-        mesh.merge_vertices()
-        mesh.fix_normals()
+        if auto_repair:
+            self._repair(mesh)
 
         display_name = path.stem  # e.g. "bracket" from bracket.stl
         return display_name, mesh
 
     def load_many(self, file_paths: List[str]) -> List[Tuple[str, trimesh.Trimesh]]:
-        """Convenience: load several files at once."""
-        return [self.load(fp) for fp in file_paths]
+        """Load several files concurrently; results keep the input order."""
+        if len(file_paths) <= 1:
+            return [self.load(fp) for fp in file_paths]
+
+        workers = min(_MAX_LOAD_WORKERS, len(file_paths))
+        heavy = [i for i, fp in enumerate(file_paths) if self._parse_in_process(fp)]
+        heavy_set = set(heavy)
+        results: List[Optional[Tuple[str, trimesh.Trimesh]]] = [None] * len(file_paths)
+
+        with ThreadPoolExecutor(max_workers=workers) as threads:
+            futures = {i: threads.submit(self.load, fp)
+                       for i, fp in enumerate(file_paths) if i not in heavy_set}
+            if heavy:
+                with ProcessPoolExecutor(max_workers=min(workers, len(heavy))) as procs:
+                    loaded = procs.map(_load_one, [file_paths[i] for i in heavy])
+                    for i, result in zip(heavy, loaded):
+                        results[i] = result
+            for i, future in futures.items():
+                results[i] = future.result()
+        return results
 
     @staticmethod
     def supported_extensions() -> List[str]:
@@ -75,6 +102,19 @@ class AssetLoader:
     # ------------------------------------------------------------------
     # internals
     # ------------------------------------------------------------------
+    @staticmethod
+    def _repair(mesh: trimesh.Trimesh) -> None:
+        """Merge close vertices and fix normals."""
+        mesh.merge_vertices()
+        mesh.fix_normals()
+
+    @staticmethod
+    def _parse_in_process(file_path: str) -> bool:
+        path = Path(file_path)
+        return (path.suffix.lower() in _PROCESS_PARSE_EXTENSIONS
+                and path.is_file()
+                and path.stat().st_size >= _PROCESS_PARSE_MIN_BYTES)
+
     def _validate(self, path: Path) -> None:
         if not path.exists():
             raise AssetLoadError(f"File not found: {path}")
@@ -101,3 +141,8 @@ class AssetLoader:
             return combined
 
         raise AssetLoadError(f"Unexpected object type from trimesh: {type(loaded)}")
+
+
+def _load_one(file_path: str) -> Tuple[str, trimesh.Trimesh]:
+    """Process-pool entry point for ``AssetLoader.load_many``."""
+    return AssetLoader().load(file_path)
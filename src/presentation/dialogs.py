@@ -7,76 +7,184 @@ industrial aesthetic with proper input validation.
 """
 from __future__ import annotations
 
-from typing import Dict, Optional
+from functools import partial
+from typing import Callable, Dict, List, NamedTuple, Optional, Tuple
 
 from PySide6.QtWidgets import (
-    QDialog, QDialogButtonBox, QFormLayout, QLabel,
+    QAbstractSpinBox, QDialog, QDialogButtonBox, QFormLayout, QLabel,
     QDoubleSpinBox, QSpinBox, QVBoxLayout, QHBoxLayout,
-    QPushButton, QGroupBox, QCheckBox, QFrame, QScrollArea,
-    QSizePolicy, QWidget,
+    QPushButton, QGroupBox, QFrame, QListView, QStackedWidget, QWidget,
+    QApplication, QStyle, QStyledItemDelegate, QStyleOptionButton,
 )
-from PySide6.QtCore import Qt
-from PySide6.QtGui import QFont
+from PySide6.QtCore import (
+    Qt, Signal, QAbstractListModel, QEvent, QModelIndex, QRect, QSize,
+)
+from PySide6.QtGui import QColor, QFont, QPainter, QPixmap, QTextDocument
 
 from src.application.slicer_service import MATERIAL_PRESETS, PROFILE_PRESETS
 
+__all__ = [
+    "SettingsDialog", "MaterialDialog", "ProfileDialog",
+    "BuildPlateDialog", "AboutDialog", "DIALOG_STYLESHEET", "shared_dialog",
+]
+
 
 # ======================================================================
 #  Shared dialog stylesheet
 # ======================================================================
 
-_DIALOG_STYLE = """
+# Every selector is scoped under QDialog so the sheet can be appended to
+# the application stylesheet (see ``main_window.get_stylesheet``): it is
+# parsed once there and applies to every dialog.
+DIALOG_STYLESHEET = """
 QDialog {
     background-color: #FFFFFF;
 }
-QGroupBox {
+QDialog QGroupBox {
     font-weight: bold;
     border: 1px solid #D0D0D0;
     border-radius: 5px;
     margin-top: 12px;
     padding: 14px 10px 10px 10px;
 }
-QGroupBox::title {
+QDialog QGroupBox::title {
     subcontrol-origin: margin;
     left: 14px;
     padding: 0 6px;
 }
-QPushButton {
+QDialog QPushButton {
     padding: 6px 16px;
     border-radius: 4px;
     border: 1px solid #D0D0D0;
     background: #F5F5F5;
     font-size: 12px;
 }
-QPushButton:hover { background: #E8E8E8; }
-QPushButton:pressed { background: #D8D8D8; }
-#PrimaryBtn {
+QDialog QPushButton:hover { background: #E8E8E8; }
+QDialog QPushButton:pressed { background: #D8D8D8; }
+QDialog #PrimaryBtn {
     background: #2688EB;
     color: #FFFFFF;
     border: none;
     font-weight: bold;
 }
-#PrimaryBtn:hover { background: #1A75D2; }
-#PrimaryBtn:pressed { background: #1565B5; }
-QDoubleSpinBox, QSpinBox {
+QDialog #PrimaryBtn:hover { background: #1A75D2; }
+QDialog #PrimaryBtn:pressed { background: #1565B5; }
+QDialog QDoubleSpinBox, QDialog QSpinBox {
     padding: 4px 8px;
     border: 1px solid #D0D0D0;
     border-radius: 4px;
     min-height: 24px;
 }
-QDoubleSpinBox:focus, QSpinBox:focus { border-color: #2688EB; }
-QLabel { font-size: 13px; }
+QDialog QDoubleSpinBox:focus, QDialog QSpinBox:focus { border-color: #2688EB; }
+QDialog QLabel { font-size: 13px; }
+QDialog QLabel#HeaderLabel { color: #555555; font-size: 12px; }
+QDialog QLabel#CardParam { color: #333333; font-size: 12px; }
+QDialog QLabel#DescLabel { color: #737373; font-size: 12px; }
+QDialog QFrame#Separator { color: #D0D0D0; }
 """
 
 
+def _apply_style(dialog: QDialog) -> None:
+    """Give *dialog* its own copy of the sheet if the app lacks it.
+
+    Once the main window has installed the application stylesheet every
+    dialog inherits ``DIALOG_STYLESHEET`` and skips the per-instance parse.
+    """
+    app = QApplication.instance()
+    if app is None or DIALOG_STYLESHEET not in app.styleSheet():
+        dialog.setStyleSheet(DIALOG_STYLESHEET)
+
+
+_shared_dialogs: Dict[type, QDialog] = {}
+
+
+def _forget_dialog(cls: type, dlg: QDialog, *_args) -> None:
+    """Drop *dlg* from the cache once Qt destroys it (e.g. with its parent)."""
+    if _shared_dialogs.get(cls) is dlg:
+        del _shared_dialogs[cls]
+
+
+def shared_dialog(cls, *args, parent=None):
+    """Return the process-wide instance of dialog *cls*, reset for reuse.
+
+    The first call builds the dialog; later calls hand *args* to its
+    ``refresh`` instead of rebuilding every widget on each open.
+    """
+    dlg = _shared_dialogs.get(cls)
+    if dlg is None or dlg.parentWidget() is not parent:
+        dlg = cls(*args, parent=parent)
+        dlg.destroyed.connect(partial(_forget_dialog, cls, dlg))
+        _shared_dialogs[cls] = dlg
+    else:
+        dlg.refresh(*args)
+    return dlg
+
+
 # ======================================================================
 #  Settings Dialog
 # ======================================================================
 
+class _Spin(NamedTuple):
+    """Range, precision and default of one numeric settings field."""
+    minimum: float
+    maximum: float
+    decimals: Optional[int]     # None -> integer QSpinBox
+    step: float
+    suffix: str
+    default: float
+
+
+# (group title, ((param key, row label, spin spec), ...))
+_SETTINGS_SPEC = (
+    ("Laser && Scanning", (
+        ("layer_thickness", "Layer Thickness:",
+         _Spin(0.005, 1.0, 3, 0.005, "  mm", 0.030)),
+        ("laser_power", "Laser Power:",
+         _Spin(10.0, 1000.0, 1, 10.0, "  W", 200.0)),
+        ("scan_speed", "Scan Speed:",
+         _Spin(10.0, 10000.0, 1, 50.0, "  mm/s", 1000.0)),
+    )),
+    ("Hatching", (
+        ("hatch_spacing", "Hatch Spacing:",
+         _Spin(0.01, 2.0, 3, 0.01, "  mm", 0.10)),
+        ("hatch_angle_increment", "Angle Increment:",
+         _Spin(0.0, 180.0, 1, 5.0, "  \u00B0", 67.0)),
+    )),
+    ("Contours", (
+        ("contour_count", "Contour Count:",
+         _Spin(0, 10, None, 1, "", 1)),
+        ("contour_offset", "Contour Offset:",
+         _Spin(0.0, 2.0, 3, 0.01, "  mm", 0.05)),
+    )),
+)
+
+
+def _make_spin(spec: _Spin, value: float) -> QAbstractSpinBox:
+    """Build a configured spinbox for *spec* showing *value*."""
+    if spec.decimals is None:
+        sb = QSpinBox()
+        sb.setRange(int(spec.minimum), int(spec.maximum))
+        sb.setSingleStep(int(spec.step))
+        sb.setValue(int(value))
+    else:
+        sb = QDoubleSpinBox()
+        sb.setRange(spec.minimum, spec.maximum)
+        sb.setDecimals(spec.decimals)
+        sb.setSingleStep(spec.step)
+        sb.setValue(value)
+    if spec.suffix:
+        sb.setSuffix(spec.suffix)
+    return sb
+
+
 class SettingsDialog(QDialog):
     """
     Comprehensive SLM process parameter editor.
     All numeric values validated with QDoubleSpinBox/QSpinBox.
+
+    Open it through ``shared_dialog`` so it is built once per process:
+    reopening only calls ``refresh``, so the form rows (and the row labels
+    QFormLayout creates for them) are reused rather than rebuilt.
     """
 
     def __init__(self, current_params: Dict[str, float], parent=None):
@@ -84,89 +192,35 @@ class SettingsDialog(QDialog):
         self.setWindowTitle("Process Settings")
         self.setModal(True)
         self.setMinimumWidth(440)
-        self.setStyleSheet(_DIALOG_STYLE)
-        self.params = current_params.copy()
+        _apply_style(self)
+        # The caller's dict is only read; edits are kept in _overrides.
+        self._orig = current_params
+        self._overrides: Dict[str, float] = {}
+        # One layout pass once everything is in place, not one per row.
+        self.setUpdatesEnabled(False)
         self._build_ui()
+        self.setUpdatesEnabled(True)
 
     def _build_ui(self) -> None:
         root = QVBoxLayout(self)
         root.setSpacing(10)
 
-        # ---- Laser & Scanning ----
-        grp_laser = QGroupBox("Laser && Scanning")
-        form1 = QFormLayout(grp_laser)
-        form1.setLabelAlignment(Qt.AlignRight)
-
-        self.sp_layer = QDoubleSpinBox()
-        self.sp_layer.setRange(0.005, 1.0)
-        self.sp_layer.setDecimals(3)
-        self.sp_layer.setSingleStep(0.005)
-        self.sp_layer.setSuffix("  mm")
-        self.sp_layer.setValue(self.params.get("layer_thickness", 0.030))
-        form1.addRow("Layer Thickness:", self.sp_layer)
-
-        self.sp_power = QDoubleSpinBox()
-        self.sp_power.setRange(10.0, 1000.0)
-        self.sp_power.setDecimals(1)
-        self.sp_power.setSingleStep(10.0)
-        self.sp_power.setSuffix("  W")
-        self.sp_power.setValue(self.params.get("laser_power", 200.0))
-        form1.addRow("Laser Power:", self.sp_power)
-
-        self.sp_speed = QDoubleSpinBox()
-        self.sp_speed.setRange(10.0, 10000.0)
-        self.sp_speed.setDecimals(1)
-        self.sp_speed.setSingleStep(50.0)
-        self.sp_speed.setSuffix("  mm/s")
-        self.sp_speed.setValue(self.params.get("scan_speed", 1000.0))
-        form1.addRow("Scan Speed:", self.sp_speed)
-
-        root.addWidget(grp_laser)
-
-        # ---- Hatching ----
-        grp_hatch = QGroupBox("Hatching")
-        form2 = QFormLayout(grp_hatch)
-        form2.setLabelAlignment(Qt.AlignRight)
-
-        self.sp_hatch_sp = QDoubleSpinBox()
-        self.sp_hatch_sp.setRange(0.01, 2.0)
-        self.sp_hatch_sp.setDecimals(3)
-        self.sp_hatch_sp.setSingleStep(0.01)
-        self.sp_hatch_sp.setSuffix("  mm")
-        self.sp_hatch_sp.setValue(self.params.get("hatch_spacing", 0.10))
-        form2.addRow("Hatch Spacing:", self.sp_hatch_sp)
-
-        self.sp_hatch_ang = QDoubleSpinBox()
-        self.sp_hatch_ang.setRange(0.0, 180.0)
-        self.sp_hatch_ang.setDecimals(1)
-        self.sp_hatch_ang.setSingleStep(5.0)
-        self.sp_hatch_ang.setSuffix("  \u00B0")
-        self.sp_hatch_ang.setValue(
-            self.params.get("hatch_angle_increment", 67.0))
-        form2.addRow("Angle Increment:", self.sp_hatch_ang)
-
-        root.addWidget(grp_hatch)
-
-        # ---- Contours ----
-        grp_contour = QGroupBox("Contours")
-        form3 = QFormLayout(grp_contour)
-        form3.setLabelAlignment(Qt.AlignRight)
-
-        self.sp_contour_n = QSpinBox()
-        self.sp_contour_n.setRange(0, 10)
-        self.sp_contour_n.setValue(int(self.params.get("contour_count", 1)))
-        form3.addRow("Contour Count:", self.sp_contour_n)
-
-        self.sp_contour_off = QDoubleSpinBox()
-        self.sp_contour_off.setRange(0.0, 2.0)
-        self.sp_contour_off.setDecimals(3)
-        self.sp_contour_off.setSingleStep(0.01)
-        self.sp_contour_off.setSuffix("  mm")
-        self.sp_contour_off.setValue(
-            self.params.get("contour_offset", 0.05))
-        form3.addRow("Contour Offset:", self.sp_contour_off)
-
-        root.addWidget(grp_contour)
+        # Bound value()/setValue() per parameter key, looked up once here
+        # rather than on every accept/refresh.
+        self._fields: List[Tuple[str, Callable[[], float]]] = []
+        self._setters: List[Tuple[str, Callable, type, float]] = []
+        for title, rows in _SETTINGS_SPEC:
+            grp = QGroupBox(title)
+            form = QFormLayout(grp)
+            form.setLabelAlignment(Qt.AlignRight)
+            for key, label, spec in rows:
+                sb = _make_spin(spec, self._orig.get(key, spec.default))
+                form.addRow(label, sb)
+                self._fields.append((key, sb.value))
+                self._setters.append((key, sb.setValue,
+                                      float if spec.decimals else int,
+                                      spec.default))
+            root.addWidget(grp)
 
         # ---- Buttons ----
         bbox = QDialogButtonBox(
@@ -176,27 +230,105 @@ class SettingsDialog(QDialog):
         root.addWidget(bbox)
 
     def _on_accept(self) -> None:
-        self.params["layer_thickness"] = self.sp_layer.value()
-        self.params["laser_power"] = self.sp_power.value()
-        self.params["scan_speed"] = self.sp_speed.value()
-        self.params["hatch_spacing"] = self.sp_hatch_sp.value()
-        self.params["hatch_angle_increment"] = self.sp_hatch_ang.value()
-        self.params["contour_count"] = self.sp_contour_n.value()
-        self.params["contour_offset"] = self.sp_contour_off.value()
+        orig = self._orig
+        self._overrides = {
+            key: value for key, get in self._fields
+            if (value := get()) != orig.get(key)
+        }
         self.accept()
 
+    def refresh(self, current_params: Dict[str, float]) -> None:
+        p = self._orig = current_params
+        self._overrides = {}
+        for key, set_value, cast, default in self._setters:
+            set_value(cast(p.get(key, default)))
+
     def get_params(self) -> Dict[str, float]:
-        return self.params
+        """The original parameters with the accepted edits applied."""
+        return {**self._orig, **self._overrides}
 
 
 # ======================================================================
 #  Material Dialog
 # ======================================================================
 
+class _MaterialListModel(QAbstractListModel):
+    """Read-only list model over the names in ``MATERIAL_PRESETS``."""
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self._names = tuple(MATERIAL_PRESETS)
+
+    def rowCount(self, parent=QModelIndex()) -> int:       # noqa: N802
+        return 0 if parent.isValid() else len(self._names)
+
+    def data(self, index: QModelIndex, role: int = Qt.DisplayRole):
+        if index.isValid() and role == Qt.DisplayRole:
+            return self._names[index.row()]
+        return None
+
+
+class _MaterialDelegate(QStyledItemDelegate):
+    """Paints a material row (name, summary, Apply button) with QPainter.
+
+    No per-row widgets exist; the view only asks the delegate to paint
+    the rows that are visible, and clicks on the painted button are
+    hit-tested in ``editorEvent``.
+    """
+
+    apply_requested = Signal(str)
+
+    _ROW_HEIGHT = 46
+    _BTN_WIDTH = 64
+
+    def sizeHint(self, option, index) -> QSize:             # noqa: N802
+        return QSize(option.rect.width(), self._ROW_HEIGHT)
+
+    def _button_rect(self, rect: QRect) -> QRect:
+        return QRect(rect.right() - self._BTN_WIDTH - 6, rect.top() + 9,
+                     self._BTN_WIDTH, rect.height() - 18)
+
+    def paint(self, painter, option, index) -> None:
+        name = index.data(Qt.DisplayRole)
+        widget = option.widget
+        style = widget.style() if widget else QApplication.style()
+        style.drawPrimitive(QStyle.PE_PanelItemViewItem, option, painter,
+                            widget)
+
+        rect = option.rect
+        text_rect = rect.adjusted(8, 4, -(self._BTN_WIDTH + 14), -4)
+        painter.save()
+        font = QFont(option.font)
+        font.setBold(True)
+        painter.setFont(font)
+        painter.drawText(text_rect, Qt.AlignLeft | Qt.AlignTop, name)
+        painter.setFont(option.font)
+        painter.setPen(QColor("#737373"))
+        painter.drawText(text_rect, Qt.AlignLeft | Qt.AlignBottom,
+                         _MATERIAL_SUMMARY[name])
+        painter.restore()
+
+        btn = QStyleOptionButton()
+        btn.rect = self._button_rect(rect)
+        btn.text = "Apply"
+        btn.state = QStyle.State_Enabled | QStyle.State_Raised
+        style.drawControl(QStyle.CE_PushButton, btn, painter, widget)
+
+    def editorEvent(self, event, model, option, index) -> bool:  # noqa: N802
+        if (event.type() == QEvent.MouseButtonRelease
+                and event.button() == Qt.LeftButton
+                and self._button_rect(option.rect).contains(
+                    event.position().toPoint())):
+            self.apply_requested.emit(index.data(Qt.DisplayRole))
+            return True
+        return super().editorEvent(event, model, option, index)
+
+
 class MaterialDialog(QDialog):
     """
     Material library dialog with card-based preset selection.
-    Each material shows recommended parameters and an Apply button.
+    Materials are listed in a model/view list whose rows are painted by
+    a delegate; selecting one shows its recommended parameters.
     """
 
     def __init__(self, parent=None):
@@ -204,9 +336,11 @@ class MaterialDialog(QDialog):
         self.setWindowTitle("Material Library")
         self.setModal(True)
         self.setMinimumSize(460, 420)
-        self.setStyleSheet(_DIALOG_STYLE)
+        _apply_style(self)
         self.selected_material: Optional[str] = None
+        self.setUpdatesEnabled(False)
         self._build_ui()
+        self.setUpdatesEnabled(True)
 
     def _build_ui(self) -> None:
         root = QVBoxLayout(self)
@@ -217,44 +351,74 @@ class MaterialDialog(QDialog):
             "to the current process settings."
         )
         header.setWordWrap(True)
-        header.setStyleSheet("color: #555555; font-size: 12px;")
+        header.setObjectName("HeaderLabel")
         root.addWidget(header)
 
-        scroll = QScrollArea()
-        scroll.setWidgetResizable(True)
-        scroll.setHorizontalScrollBarPolicy(Qt.ScrollBarAlwaysOff)
-        container = QWidget()
-        scroll_lay = QVBoxLayout(container)
-        scroll_lay.setSpacing(8)
-
-        for mat_name, params in MATERIAL_PRESETS.items():
-            card = QGroupBox(mat_name)
-            card_lay = QVBoxLayout(card)
-
-            for key, value in params.items():
-                nice = key.replace("_", " ").title()
-                unit = _param_unit(key)
-                lbl = QLabel(f"{nice}:  {value} {unit}")
-                lbl.setStyleSheet("font-size: 12px; color: #333;")
-                card_lay.addWidget(lbl)
-
-            btn = QPushButton(f"Apply {mat_name}")
-            btn.setObjectName("PrimaryBtn")
-            btn.setCursor(Qt.PointingHandCursor)
-            btn.clicked.connect(
-                lambda _=False, m=mat_name: self._on_apply(m))
-            card_lay.addWidget(btn)
-            scroll_lay.addWidget(card)
-
-        scroll_lay.addStretch()
-        scroll.setWidget(container)
-        root.addWidget(scroll, stretch=1)
+        # Rows are painted on demand; the detail card for a material is
+        # built the first time it is selected and kept in ``self._panels``.
+        body = QHBoxLayout()
+        self.mat_view = QListView()
+        self.mat_view.setFixedWidth(240)
+        self.mat_view.setUniformItemSizes(True)
+        self.mat_view.setModel(_MaterialListModel(self.mat_view))
+        delegate = _MaterialDelegate(self.mat_view)
+        delegate.apply_requested.connect(self._on_apply)
+        self.mat_view.setItemDelegate(delegate)
+        body.addWidget(self.mat_view)
+
+        self.detail = QStackedWidget()
+        body.addWidget(self.detail, stretch=1)
+        root.addLayout(body, stretch=1)
+
+        self._panels: Dict[str, QWidget] = {}
+        self.mat_view.selectionModel().currentRowChanged.connect(
+            self._on_row_changed)
+        model = self.mat_view.model()
+        if model.rowCount():
+            self.mat_view.setCurrentIndex(model.index(0))
 
         close_btn = QPushButton("Close")
         close_btn.clicked.connect(self.reject)
         root.addWidget(close_btn, alignment=Qt.AlignRight)
 
-    def _on_apply(self, name: str) -> None:
+    def _on_row_changed(self, current: QModelIndex,
+                        _previous: QModelIndex) -> None:
+        if not current.isValid():
+            return
+        mat_name = current.data(Qt.DisplayRole)
+        panel = self._panels.get(mat_name)
+        if panel is None:
+            self.detail.setUpdatesEnabled(False)
+            panel = self._build_card(mat_name)
+            self._panels[mat_name] = panel
+            self.detail.addWidget(panel)
+            self.detail.setCurrentWidget(panel)
+            self.detail.setUpdatesEnabled(True)
+        else:
+            self.detail.setCurrentWidget(panel)
+
+    def _build_card(self, mat_name: str) -> QWidget:
+        card = QGroupBox(mat_name)
+        card_lay = QVBoxLayout(card)
+
+        lbl = QLabel(_MATERIAL_CARD_HTML[mat_name])
+        lbl.setObjectName("CardParam")
+        lbl.setTextFormat(Qt.RichText)
+        lbl.setTextInteractionFlags(Qt.NoTextInteraction)
+        card_lay.addWidget(lbl)
+
+        card_lay.addStretch()
+        btn = QPushButton(f"Apply {mat_name}")
+        btn.setObjectName("PrimaryBtn")
+        btn.setCursor(Qt.PointingHandCursor)
+        btn.clicked.connect(partial(self._on_apply, mat_name))
+        card_lay.addWidget(btn)
+        return card
+
+    def refresh(self) -> None:
+        self.selected_material = None
+
+    def _on_apply(self, name: str, _checked: bool = False) -> None:
         self.selected_material = name
         self.accept()
 
@@ -271,7 +435,7 @@ class ProfileDialog(QDialog):
         self.setWindowTitle("Quality Profiles")
         self.setModal(True)
         self.setMinimumWidth(380)
-        self.setStyleSheet(_DIALOG_STYLE)
+        _apply_style(self)
         self.selected_profile: Optional[str] = None
         self._build_ui()
 
@@ -280,16 +444,14 @@ class ProfileDialog(QDialog):
         root.setSpacing(8)
 
         header = QLabel("Select a layer-thickness profile:")
-        header.setStyleSheet("color: #555555; font-size: 12px;")
+        header.setObjectName("HeaderLabel")
         root.addWidget(header)
 
-        for name, thickness in PROFILE_PRESETS.items():
-            btn = QPushButton(
-                f"{name}   \u2014   {thickness * 1000:.0f} \u00B5m layer")
+        for name, text in _PROFILE_BUTTON_TEXT.items():
+            btn = QPushButton(text)
             btn.setMinimumHeight(36)
             btn.setCursor(Qt.PointingHandCursor)
-            btn.clicked.connect(
-                lambda _=False, p=name: self._on_apply(p))
+            btn.clicked.connect(partial(self._on_apply, name))
             root.addWidget(btn)
 
         root.addStretch()
@@ -298,7 +460,10 @@ class ProfileDialog(QDialog):
         close_btn.clicked.connect(self.reject)
         root.addWidget(close_btn, alignment=Qt.AlignRight)
 
-    def _on_apply(self, name: str) -> None:
+    def refresh(self) -> None:
+        self.selected_profile = None
+
+    def _on_apply(self, name: str, _checked: bool = False) -> None:
         self.selected_profile = name
         self.accept()
 
@@ -316,7 +481,7 @@ class BuildPlateDialog(QDialog):
         self.setWindowTitle("Build Plate Configuration")
         self.setModal(True)
         self.setMinimumWidth(340)
-        self.setStyleSheet(_DIALOG_STYLE)
+        _apply_style(self)
         self.diameter = current_diameter
         self.height = current_height
         self._build_ui()
@@ -350,6 +515,13 @@ class BuildPlateDialog(QDialog):
         bbox.rejected.connect(self.reject)
         root.addWidget(bbox)
 
+    def refresh(self, current_diameter: float,
+                current_height: float) -> None:
+        self.diameter = current_diameter
+        self.height = current_height
+        self.sp_dia.setValue(current_diameter)
+        self.sp_h.setValue(current_height)
+
     def _on_accept(self) -> None:
         self.diameter = self.sp_dia.value()
         self.height = self.sp_h.value()
@@ -360,6 +532,52 @@ class BuildPlateDialog(QDialog):
 #  About Dialog
 # ======================================================================
 
+_ABOUT_TITLE_HTML = "<div align='center'>PySLM Industrial Slicer</div>"
+_ABOUT_INFO_HTML = (
+    "<table style='font-size:13px; line-height:1.6;'>"
+    "<tr><td><b>Version:</b></td><td>1.0.0</td></tr>"
+    "<tr><td><b>Architecture:</b></td>"
+    "<td>Clean Architecture + DDD</td></tr>"
+    "<tr><td><b>Engine:</b></td><td>PySLM / trimesh</td></tr>"
+    "<tr><td><b>GUI Framework:</b></td>"
+    "<td>PySide6 + PyVistaQt</td></tr>"
+    "<tr><td><b>3D Rendering:</b></td>"
+    "<td>VTK via PyVista</td></tr>"
+    "<tr><td><b>Process:</b></td>"
+    "<td>Selective Laser Melting (SLM)</td></tr>"
+    "</table>"
+)
+
+# device pixel ratio -> (title, info) pixmaps, rendered on first use.
+_ABOUT_PIXMAPS: Dict[float, Tuple[QPixmap, QPixmap]] = {}
+
+
+def _render_html(html: str, font: QFont, dpr: float) -> QPixmap:
+    """Lay out *html* once and paint it into a transparent pixmap."""
+    doc = QTextDocument()
+    doc.setDefaultFont(font)
+    doc.setHtml(html)
+    size = doc.size().toSize()
+    pm = QPixmap(size * dpr)
+    pm.setDevicePixelRatio(dpr)
+    pm.fill(Qt.transparent)
+    painter = QPainter(pm)
+    doc.drawContents(painter)
+    painter.end()
+    return pm
+
+
+def _about_pixmaps(dpr: float) -> Tuple[QPixmap, QPixmap]:
+    pms = _ABOUT_PIXMAPS.get(dpr)
+    if pms is None:
+        pms = _ABOUT_PIXMAPS[dpr] = (
+            _render_html(_ABOUT_TITLE_HTML,
+                         QFont("Segoe UI", 18, QFont.Bold), dpr),
+            _render_html(_ABOUT_INFO_HTML, QFont(), dpr),
+        )
+    return pms
+
+
 class AboutDialog(QDialog):
     """Application information dialog."""
 
@@ -368,37 +586,36 @@ class AboutDialog(QDialog):
         self.setWindowTitle("About PySLM Slicer")
         self.setModal(True)
         self.setFixedSize(440, 340)
-        self.setStyleSheet(_DIALOG_STYLE)
-        self._build_ui()
+        _apply_style(self)
+        self._built = False
+
+    def showEvent(self, event) -> None:
+        # Widgets are only created if the dialog is actually opened.
+        if not self._built:
+            self._build_ui()
+            self._built = True
+        super().showEvent(event)
 
     def _build_ui(self) -> None:
         root = QVBoxLayout(self)
         root.setSpacing(12)
 
-        title = QLabel("PySLM Industrial Slicer")
+        # Title and info table are pre-rendered pixmaps shared by every
+        # instance, so no font or HTML layout happens per dialog.
+        title_pm, info_pm = _about_pixmaps(self.devicePixelRatioF())
+
+        title = QLabel()
+        title.setPixmap(title_pm)
         title.setAlignment(Qt.AlignCenter)
-        title.setFont(QFont("Segoe UI", 18, QFont.Bold))
         root.addWidget(title)
 
         sep = QFrame()
         sep.setFrameShape(QFrame.HLine)
-        sep.setStyleSheet("color: #D0D0D0;")
+        sep.setObjectName("Separator")
         root.addWidget(sep)
 
-        info = QLabel(
-            "<table style='font-size:13px; line-height:1.6;'>"
-            "<tr><td><b>Version:</b></td><td>1.0.0</td></tr>"
-            "<tr><td><b>Architecture:</b></td>"
-            "<td>Clean Architecture + DDD</td></tr>"
-            "<tr><td><b>Engine:</b></td><td>PySLM / trimesh</td></tr>"
-            "<tr><td><b>GUI Framework:</b></td>"
-            "<td>PySide6 + PyVistaQt</td></tr>"
-            "<tr><td><b>3D Rendering:</b></td>"
-            "<td>VTK via PyVista</td></tr>"
-            "<tr><td><b>Process:</b></td>"
-            "<td>Selective Laser Melting (SLM)</td></tr>"
-            "</table>"
-        )
+        info = QLabel()
+        info.setPixmap(info_pm)
         info.setAlignment(Qt.AlignCenter)
         root.addWidget(info)
 
@@ -410,25 +627,61 @@ class AboutDialog(QDialog):
         )
         desc.setWordWrap(True)
         desc.setAlignment(Qt.AlignCenter)
-        desc.setStyleSheet("color: #737373; font-size: 12px;")
+        desc.setObjectName("DescLabel")
         root.addWidget(desc)
 
         btn = QPushButton("Close")
         btn.clicked.connect(self.accept)
         root.addWidget(btn, alignment=Qt.AlignCenter)
 
+    def refresh(self) -> None:
+        pass
+
 
 # ======================================================================
 #  Utility
 # ======================================================================
 
+_PARAM_UNITS: Dict[str, str] = {
+    "laser_power": "W",
+    "scan_speed": "mm/s",
+    "hatch_spacing": "mm",
+    "hatch_angle_increment": "\u00B0",
+    "layer_thickness": "mm",
+}
+
+
 def _param_unit(key: str) -> str:
     """Return the display unit for a known parameter key."""
-    units = {
-        "laser_power": "W",
-        "scan_speed": "mm/s",
-        "hatch_spacing": "mm",
-        "hatch_angle_increment": "\u00B0",
-        "layer_thickness": "mm",
-    }
-    return units.get(key, "")
+    return _PARAM_UNITS.get(key, "")
+
+
+def _card_html(params: Dict[str, float]) -> str:
+    """A two-column rich-text table of a material's parameters."""
+    rows = "".join(
+        f"<tr><td><b>{key.replace('_', ' ').title()}:</b></td>"
+        f"<td>{value} {_param_unit(key)}</td></tr>"
+        for key, value in params.items()
+    )
+    return f"<table cellspacing='4'>{rows}</table>"
+
+
+def _card_summary(params: Dict[str, float]) -> str:
+    """Short one-line summary shown under the name in the material list."""
+    return "  \u00B7  ".join(
+        f"{params[key]:g} {_param_unit(key)}"
+        for key in ("laser_power", "scan_speed") if key in params
+    )
+
+
+# Built once at import; material cards just set this as their label text.
+_MATERIAL_CARD_HTML: Dict[str, str] = {
+    name: _card_html(params) for name, params in MATERIAL_PRESETS.items()
+}
+_MATERIAL_SUMMARY: Dict[str, str] = {
+    name: _card_summary(params) for name, params in MATERIAL_PRESETS.items()
+}
+_PROFILE_BUTTON_TEXT: Dict[str, str] = {
+    name: f"{name}   \u2014   {thickness * 1000:.0f} \u00B5m layer"
+    for name, thickness in PROFILE_PRESETS.items()
+}
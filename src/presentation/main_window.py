@@ -22,24 +22,33 @@ Layout
 """
 from __future__ import annotations
 
-from typing import TYPE_CHECKING, Optional
+from functools import lru_cache, partial
+from typing import TYPE_CHECKING, Callable, Dict, List, Optional, Tuple
 from pathlib import Path
 
 from PySide6.QtWidgets import (
-    QMainWindow, QWidget, QVBoxLayout, QHBoxLayout, QGridLayout,
+    QAbstractButton, QApplication, QMainWindow, QWidget, QVBoxLayout, QHBoxLayout, QGridLayout,
     QFrame, QPushButton, QLabel, QComboBox, QFormLayout,
     QProgressBar, QFileDialog, QMessageBox, QStatusBar,
     QScrollArea, QTreeWidget, QTreeWidgetItem, QButtonGroup,
-    QDoubleSpinBox, QSizePolicy, QSpacerItem,
+    QDoubleSpinBox, QStyle, QStyledItemDelegate,
+    QStyleOptionViewItem, QHeaderView,
+)
+from PySide6.QtCore import (
+    Qt, Signal, Slot, QEvent, QObject, QSignalMapper, QThreadPool, QTimer,
+    QSize, QLine, QPoint, QPointF, QRect,
+)
+from PySide6.QtGui import (
+    QAction, QKeySequence, QFont, QColor, QIcon, QPainter, QPixmap,
+    QPixmapCache, QPolygonF,
 )
-from PySide6.QtCore import Qt, Slot, QTimer, QSize
-from PySide6.QtGui import QAction, QKeySequence, QFont
 
+from src.application.slicer_service import MATERIAL_PRESETS, PROFILE_PRESETS
 from src.presentation.viewport_widget import SLMViewport
-from src.presentation.workers import SlicingThread
+from src.presentation.workers import MeshLoadRunnable, SlicingRunnable
 from src.presentation.dialogs import (
-    SettingsDialog, MaterialDialog, ProfileDialog,
-    BuildPlateDialog, AboutDialog,
+    DIALOG_STYLESHEET, AboutDialog, BuildPlateDialog, MaterialDialog,
+    ProfileDialog, SettingsDialog, shared_dialog,
 )
 
 if TYPE_CHECKING:
@@ -48,6 +57,15 @@ if TYPE_CHECKING:
     from src.infrastructure.repositories.asset_loader import AssetLoader
 
 
+# Qt enum values used while building widgets, looked up through the
+# binding once here rather than on every widget that needs them.
+_POINTING_CURSOR = Qt.PointingHandCursor
+_ALIGN_LEFT = Qt.AlignLeft
+_ALIGN_FORM = Qt.AlignLeft | Qt.AlignTop
+_ALIGN_CENTER = Qt.AlignCenter
+_ALIGN_HCENTER = Qt.AlignHCenter
+
+
 # ======================================================================
 #  Cura-inspired Stylesheet
 # ======================================================================
@@ -61,7 +79,6 @@ QMenuBar {
     background-color: #FAFAFA;
     border-bottom: 1px solid #D0D0D0;
     padding: 2px 4px;
-    font-size: 13px;
 }
 QMenuBar::item {
     padding: 4px 10px;
@@ -86,8 +103,6 @@ QMenu::separator { height: 1px; background: #E0E0E0; margin: 4px 8px; }
 }
 #LogoLabel {
     color: #FFFFFF;
-    font-size: 15px;
-    font-weight: bold;
     padding-left: 14px;
 }
 #StageTab {
@@ -95,13 +110,11 @@ QMenu::separator { height: 1px; background: #E0E0E0; margin: 4px 8px; }
     color: #9DA5B4;
     border: none;
     padding: 6px 22px;
-    font-size: 12px;
-    font-weight: bold;
     border-radius: 4px;
     letter-spacing: 1px;
 }
-#StageTab:checked { background: #2688EB; color: #FFFFFF; }
-#StageTab:hover:!checked { background: #333640; color: #D0D4DC; }
+#StageTab[hover="true"][checked="false"] { background: #333640; color: #D0D4DC; }
+#StageTab[checked="true"] { background: #2688EB; color: #FFFFFF; }
 #HeaderCombo {
     background: #2E323C;
     color: #D0D4DC;
@@ -109,9 +122,8 @@ QMenu::separator { height: 1px; background: #E0E0E0; margin: 4px 8px; }
     border-radius: 4px;
     padding: 3px 8px;
     min-width: 130px;
-    font-size: 12px;
 }
-#HeaderCombo:hover { border-color: #2688EB; }
+#HeaderCombo[hover="true"] { border-color: #2688EB; }
 #HeaderCombo QAbstractItemView {
     background: #2E323C;
     color: #D0D4DC;
@@ -121,7 +133,6 @@ QMenu::separator { height: 1px; background: #E0E0E0; margin: 4px 8px; }
 /* === Tool sidebar ======================================= */
 #ToolSidebar {
     background-color: #FFFFFF;
-    border-right: 1px solid #D0D0D0;
     min-width: 46px;
     max-width: 46px;
 }
@@ -131,35 +142,18 @@ QMenu::separator { height: 1px; background: #E0E0E0; margin: 4px 8px; }
     border-radius: 4px;
     min-width: 38px;  min-height: 38px;
     max-width: 38px;  max-height: 38px;
-    font-size: 16px;
     color: #555555;
 }
 .ToolBtn:checked { background: #2688EB; color: #FFFFFF; }
 .ToolBtn:hover:!checked { background: #E8E8E8; }
 
-/* small camera-preset buttons */
-.ViewBtn {
-    background: #F2F2F2;
-    border: 1px solid #D0D0D0;
-    border-radius: 3px;
-    min-width: 36px;  min-height: 24px;
-    max-width: 36px;  max-height: 24px;
-    font-size: 9px;
-    color: #555555;
-    padding: 0px;
-}
-.ViewBtn:hover { background: #2688EB; color: white; border-color: #2688EB; }
-
 /* === Print-setup panel (right side) ===================== */
 #PrintSetupPanel {
     background-color: #FFFFFF;
-    border-left: 1px solid #D0D0D0;
     min-width: 310px;
     max-width: 310px;
 }
 #PanelTitle {
-    font-size: 15px;
-    font-weight: bold;
     color: #20232A;
     padding: 10px 14px 4px 14px;
 }
@@ -168,27 +162,10 @@ QMenu::separator { height: 1px; background: #E0E0E0; margin: 4px 8px; }
     border: 1px solid #D8D8D8;
     border-radius: 4px;
     padding: 8px 12px;
-    font-weight: bold;
-    font-size: 12px;
     text-align: left;
     color: #2B2B2B;
 }
-#SectionHeader:hover { background: #E4E4E4; }
-
-/* === Slice / action button ============================== */
-#SliceButton {
-    background-color: #2688EB;
-    color: #FFFFFF;
-    border: none;
-    border-radius: 5px;
-    padding: 12px 16px;
-    font-size: 14px;
-    font-weight: bold;
-    min-height: 42px;
-}
-#SliceButton:hover { background-color: #1A75D2; }
-#SliceButton:pressed { background-color: #1565B5; }
-#SliceButton:disabled { background-color: #B0C4DE; color: #F0F0F0; }
+#SectionHeader[hover="true"] { background: #E4E4E4; }
 
 /* === Progress bar ======================================= */
 QProgressBar {
@@ -197,14 +174,12 @@ QProgressBar {
     text-align: center;
     height: 18px;
     background: #F0F0F0;
-    font-size: 11px;
 }
 QProgressBar::chunk { background: #2688EB; border-radius: 3px; }
 
 /* === Object list ======================================== */
 #ObjectListPanel {
     background: #FFFFFF;
-    border-top: 1px solid #D0D0D0;
     max-height: 160px;
 }
 #ObjectListToggle {
@@ -212,16 +187,13 @@ QProgressBar::chunk { background: #2688EB; border-radius: 3px; }
     border: none;
     border-top: 1px solid #D0D0D0;
     padding: 4px 10px;
-    font-size: 12px;
-    font-weight: bold;
     text-align: left;
     color: #555555;
 }
-#ObjectListToggle:hover { background: #EAEAEA; }
+#ObjectListToggle[hover="true"] { background: #EAEAEA; }
 QTreeWidget {
     border: none;
     background: #FFFFFF;
-    font-size: 12px;
     outline: none;
 }
 QTreeWidget::item { padding: 3px 0; }
@@ -242,7 +214,6 @@ QStatusBar {
     background: #FAFAFA;
     border-top: 1px solid #D0D0D0;
     color: #737373;
-    font-size: 12px;
     padding: 2px 8px;
 }
 
@@ -260,51 +231,506 @@ QScrollBar::sub-line:vertical { height: 0; }
 """
 
 
+@lru_cache(maxsize=1)
+def get_stylesheet() -> str:
+    """The full application sheet: main-window rules plus dialog rules."""
+    return _STYLESHEET + DIALOG_STYLESHEET
+
+
+@lru_cache(maxsize=16)
+def _font(px: int, bold: bool = False) -> QFont:
+    """Shared pixel-sized font; set with ``setFont`` instead of QSS ``font-size``."""
+    font = QFont()
+    font.setPixelSize(px)
+    font.setBold(bold)
+    return font
+
+
+_APPLIED = False
+
+
+def apply_app_stylesheet() -> None:
+    """Install the sheet on the QApplication once per process.
+
+    Every window and dialog then inherits it, so Qt parses it a single
+    time instead of once per ``setStyleSheet`` call.
+    """
+    global _APPLIED
+    if not _APPLIED:
+        QApplication.instance().setStyleSheet(get_stylesheet())
+        _APPLIED = True
+
+
+# ----------------------------------------------------------------------
+#  Fast-style widgets: the #id rules above match plain dynamic properties
+#  (hover / pressed / checked / disabled) instead of pseudo-states, and
+#  the properties are flipped here from the widget's own events.
+# ----------------------------------------------------------------------
+
+def _set_style_prop(widget: QWidget, name: str, value: bool) -> None:
+    if widget.property(name) != value:
+        widget.setProperty(name, value)
+        style = widget.style()
+        style.unpolish(widget)
+        style.polish(widget)
+
+
+class _FastStyleFilter(QObject):
+    """Event filter installed only on widgets tagged ``use_fast_style``."""
+
+    _CHANGES = {
+        QEvent.HoverEnter: ("hover", True),
+        QEvent.HoverLeave: ("hover", False),
+        QEvent.MouseButtonPress: ("pressed", True),
+        QEvent.MouseButtonRelease: ("pressed", False),
+    }
+
+    def eventFilter(self, obj, event) -> bool:        # noqa: N802
+        etype = event.type()
+        change = self._CHANGES.get(etype)
+        if change is not None:
+            _set_style_prop(obj, *change)
+        elif etype == QEvent.EnabledChange:
+            _set_style_prop(obj, "disabled", not obj.isEnabled())
+        return False
+
+
+_FAST_STYLE_FILTER: Optional[_FastStyleFilter] = None
+
+
+def _use_fast_style(widget: QWidget) -> None:
+    """Drive *widget*'s state rules through dynamic properties."""
+    global _FAST_STYLE_FILTER
+    if _FAST_STYLE_FILTER is None:
+        _FAST_STYLE_FILTER = _FastStyleFilter()
+    widget.setAttribute(Qt.WA_Hover, True)
+    widget.setAttribute(Qt.WA_StyledBackground, True)
+    widget.setProperty("use_fast_style", True)
+    widget.setProperty("hover", False)
+    widget.setProperty("pressed", False)
+    widget.setProperty("disabled", not widget.isEnabled())
+    if isinstance(widget, QAbstractButton) and widget.isCheckable():
+        widget.setProperty("checked", widget.isChecked())
+        widget.toggled.connect(partial(_set_style_prop, widget, "checked"))
+    widget.installEventFilter(_FAST_STYLE_FILTER)
+
+
+_STATIC_TYPES = (QLabel, QFrame)
+
+
+def _disable_hover(root: QWidget) -> None:
+    """Turn off hover tracking on the plain labels and frames under *root*.
+
+    Only exact ``QLabel`` / ``QFrame`` instances are touched -- subclasses
+    such as scroll areas and item views keep their hover behaviour.
+    """
+    for widget in root.findChildren(QFrame):
+        if type(widget) in _STATIC_TYPES:
+            widget.setAttribute(Qt.WA_Hover, False)
+
+
+# ======================================================================
+#  Button builder
+# ======================================================================
+
+def _make_buttons(
+    parent: QWidget,
+    specs: List[Tuple[str, str, str]],
+    css_class: str = "",
+) -> List[QPushButton]:
+    """Create checkable buttons from ``(text, object_name, tooltip)`` specs.
+
+    Names, class and checkability are set before the buttons are parented
+    and *parent* has updates suspended for the batch, so they are styled
+    in one pass rather than one per button.
+    """
+    parent.setUpdatesEnabled(False)
+    buttons = []
+    for text, object_name, tip in specs:
+        btn = QPushButton(text)
+        if object_name:
+            btn.setObjectName(object_name)
+        if css_class:
+            btn.setProperty("class", css_class)
+        btn.setCheckable(True)
+        if tip:
+            btn.setToolTip(tip)
+        btn.setParent(parent)
+        buttons.append(btn)
+    parent.setUpdatesEnabled(True)
+    return buttons
+
+
 # ======================================================================
 #  Collapsible section helper
 # ======================================================================
 
 class CollapsibleSection(QWidget):
-    """Cura-style collapsible settings section with a toggle header."""
+    """Cura-style collapsible settings section with a toggle header.
 
-    def __init__(self, title: str, parent=None):
+    If *content_builder* is given, it is called with the section to fill
+    in its rows the first time the section is expanded, so a section that
+    starts collapsed creates no content widgets until it is opened.
+    """
+
+    def __init__(
+        self,
+        title: str,
+        parent=None,
+        content_builder: Optional[Callable[["CollapsibleSection"], None]] = None,
+        collapsed: bool = False,
+    ):
         super().__init__(parent)
-        self._title = title
-        self._collapsed = False
+        self._collapsed = collapsed
+        self._builder = content_builder
 
         layout = QVBoxLayout(self)
         layout.setContentsMargins(0, 2, 0, 2)
         layout.setSpacing(0)
 
-        self.toggle_btn = QPushButton(f"\u25BC  {title}")
+        self.toggle_btn = QPushButton(title)
+        self.toggle_btn.setIcon(self._icons()[1 if collapsed else 0])
         self.toggle_btn.setObjectName("SectionHeader")
-        self.toggle_btn.setCursor(Qt.PointingHandCursor)
+        self.toggle_btn.setFont(_font(12, bold=True))
+        self.toggle_btn.setCursor(_POINTING_CURSOR)
         self.toggle_btn.clicked.connect(self._toggle)
+        _use_fast_style(self.toggle_btn)
         layout.addWidget(self.toggle_btn)
 
+        # One form layout for all rows -- no per-row QHBoxLayout.
         self.content = QWidget()
-        self.content_layout = QVBoxLayout(self.content)
+        self.content_layout = QFormLayout(self.content)
         self.content_layout.setContentsMargins(10, 6, 10, 10)
-        self.content_layout.setSpacing(6)
+        self.content_layout.setLabelAlignment(_ALIGN_LEFT)
+        self.content_layout.setFormAlignment(_ALIGN_FORM)
+        self.content_layout.setHorizontalSpacing(6)
+        self.content_layout.setVerticalSpacing(6)
+        self.content.setVisible(not collapsed)
         layout.addWidget(self.content)
 
+        if not collapsed:
+            self._ensure_built()
+
+    _ICONS: Optional[Tuple[QIcon, QIcon]] = None
+
+    @classmethod
+    def _icons(cls) -> Tuple[QIcon, QIcon]:
+        """(expanded, collapsed) triangle icons, painted once per process."""
+        if cls._ICONS is None:
+            down = QPolygonF([QPointF(2, 3), QPointF(10, 3), QPointF(6, 9)])
+            right = QPolygonF([QPointF(3, 2), QPointF(9, 6), QPointF(3, 10)])
+            icons = []
+            for tri in (down, right):
+                pm = QPixmap(12, 12)
+                pm.fill(Qt.transparent)
+                painter = QPainter(pm)
+                painter.setRenderHint(QPainter.Antialiasing)
+                painter.setPen(Qt.NoPen)
+                painter.setBrush(QColor("#2B2B2B"))
+                painter.drawPolygon(tri)
+                painter.end()
+                icons.append(QIcon(pm))
+            cls._ICONS = (icons[0], icons[1])
+        return cls._ICONS
+
+    def _ensure_built(self) -> None:
+        if self._builder is not None:
+            builder, self._builder = self._builder, None
+            self.content.setUpdatesEnabled(False)
+            try:
+                builder(self)
+            finally:
+                self.content.setUpdatesEnabled(True)
+            _disable_hover(self.content)
+
     def _toggle(self) -> None:
         self._collapsed = not self._collapsed
+        if not self._collapsed:
+            self._ensure_built()
         self.content.setVisible(not self._collapsed)
-        glyph = "\u25B6" if self._collapsed else "\u25BC"
-        self.toggle_btn.setText(f"{glyph}  {self._title}")
+        self.toggle_btn.setIcon(self._icons()[1 if self._collapsed else 0])
 
     def add_row(self, label: str, widget: QWidget) -> None:
         """Add a label + widget row inside this section."""
-        row = QHBoxLayout()
-        lbl = QLabel(label)
-        lbl.setMinimumWidth(115)
-        row.addWidget(lbl)
-        row.addWidget(widget, stretch=1)
-        self.content_layout.addLayout(row)
+        self.content_layout.addRow(label, widget)
 
     def add_widget(self, widget: QWidget) -> None:
-        self.content_layout.addWidget(widget)
+        self.content_layout.addRow(widget)
+
+
+# ======================================================================
+#  Print-setup scroll area
+# ======================================================================
+
+class SectionScrollArea(QScrollArea):
+    """Scroll area that stops off-screen sections from repainting.
+
+    Sections registered with ``add_section`` have updates disabled while
+    their geometry lies outside the visible viewport, and re-enabled as
+    soon as a scroll, resize or layout move brings them back into range.
+    """
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self._sections: List[QWidget] = []
+        self.verticalScrollBar().valueChanged.connect(self._sync_visible)
+
+    def add_section(self, section: QWidget) -> None:
+        self._sections.append(section)
+        section.installEventFilter(self)
+
+    def eventFilter(self, obj, event) -> bool:        # noqa: N802
+        if event.type() in (QEvent.Move, QEvent.Resize):
+            self._sync_visible()
+        return super().eventFilter(obj, event)
+
+    def resizeEvent(self, event) -> None:            # noqa: N802
+        super().resizeEvent(event)
+        self._sync_visible()
+
+    def _sync_visible(self, *_args) -> None:
+        vp = self.viewport()
+        visible = QRect(0, self.verticalScrollBar().value(),
+                        vp.width(), vp.height())
+        for sec in self._sections:
+            on = sec.geometry().intersects(visible)
+            if sec.updatesEnabled() != on:
+                sec.setUpdatesEnabled(on)
+
+
+# ======================================================================
+#  Polled progress updates
+# ======================================================================
+
+_PROGRESS_POLL_MS = 100   # progress widgets read the slicing job at 10 Hz
+
+
+# ======================================================================
+#  Object-list row delegate
+# ======================================================================
+
+class _CachedRowDelegate(QStyledItemDelegate):
+    """Paints each object-list cell once into a ``QPixmapCache`` entry.
+
+    Repaints (scrolling, hover elsewhere, window expose) then become a
+    single pixmap blit per cell instead of a full styled text layout.
+    """
+
+    def paint(self, painter, option, index) -> None:
+        widget = option.widget
+        dpr = widget.devicePixelRatioF() if widget else 1.0
+        size = option.rect.size()
+        selected = bool(option.state & QStyle.State_Selected)
+        hovered = bool(option.state & QStyle.State_MouseOver)
+        key = (f"obj-{index.column()}-{index.data()}-{int(selected)}"
+               f"{int(hovered)}-{size.width()}x{size.height()}-{dpr}")
+
+        pm = QPixmapCache.find(key)
+        if pm is None or pm.isNull():
+            pm = QPixmap(size * dpr)
+            pm.setDevicePixelRatio(dpr)
+            pm.fill(Qt.transparent)
+            opt = QStyleOptionViewItem(option)
+            opt.rect = QRect(QPoint(0, 0), size)
+            p = QPainter(pm)
+            super().paint(p, opt, index)
+            p.end()
+            QPixmapCache.insert(key, pm)
+        painter.drawPixmap(option.rect.topLeft(), pm)
+
+
+# ======================================================================
+#  Camera-preset strip
+# ======================================================================
+
+class ViewControlStrip(QWidget):
+    """The six camera-preset buttons drawn as regions of one widget.
+
+    One ``paintEvent`` draws every cell and ``mousePressEvent`` hit-tests
+    ``_regions``, so the toolbar carries a single widget instead of six
+    styled ``QPushButton`` instances.
+    """
+
+    viewSelected = Signal(str)
+
+    VIEWS = (("F", "front"), ("T", "top"),
+             ("L", "left"),  ("R", "right"),
+             ("I", "iso"),   ("B", "back"))
+    _CELL = QSize(36, 24)
+    _GAP = 2
+    _COLS = 2
+
+    def __init__(self, parent: Optional[QWidget] = None) -> None:
+        super().__init__(parent)
+        w, h, g = self._CELL.width(), self._CELL.height(), self._GAP
+        self._regions: List[QRect] = [
+            QRect((i % self._COLS) * (w + g), (i // self._COLS) * (h + g), w, h)
+            for i in range(len(self.VIEWS))
+        ]
+        rows = (len(self.VIEWS) + self._COLS - 1) // self._COLS
+        self.setFixedSize(self._COLS * (w + g) - g, rows * (h + g) - g)
+        self.setMouseTracking(True)
+        self.setCursor(_POINTING_CURSOR)
+        self._hover = -1
+
+    def _region_at(self, pos: QPoint) -> int:
+        for i, rect in enumerate(self._regions):
+            if rect.contains(pos):
+                return i
+        return -1
+
+    def paintEvent(self, event) -> None:  # noqa: N802
+        p = QPainter(self)
+        p.setRenderHint(QPainter.Antialiasing)
+        p.setFont(_font(9))
+        for i, ((label, _), rect) in enumerate(zip(self.VIEWS, self._regions)):
+            hot = i == self._hover
+            p.setPen(QColor("#2688EB" if hot else "#D0D0D0"))
+            p.setBrush(QColor("#2688EB" if hot else "#F2F2F2"))
+            p.drawRoundedRect(rect.adjusted(0, 0, -1, -1), 3, 3)
+            p.setPen(QColor("#FFFFFF" if hot else "#555555"))
+            p.drawText(rect, _ALIGN_CENTER, label)
+        p.end()
+
+    def mouseMoveEvent(self, event) -> None:  # noqa: N802
+        idx = self._region_at(event.position().toPoint())
+        if idx != self._hover:
+            self._hover = idx
+            self.setToolTip(f"{self.VIEWS[idx][1].capitalize()} view"
+                            if idx >= 0 else "")
+            self.update()
+        super().mouseMoveEvent(event)
+
+    def leaveEvent(self, event) -> None:  # noqa: N802
+        if self._hover != -1:
+            self._hover = -1
+            self.update()
+        super().leaveEvent(event)
+
+    def mousePressEvent(self, event) -> None:  # noqa: N802
+        idx = self._region_at(event.position().toPoint())
+        if event.button() == Qt.LeftButton and idx >= 0:
+            self.viewSelected.emit(self.VIEWS[idx][1])
+        else:
+            super().mousePressEvent(event)
+
+
+# ======================================================================
+#  Slice button
+# ======================================================================
+
+class CachedSliceButton(QPushButton):
+    """Primary action button that blits a cached background per state.
+
+    The rounded fill for each (size, state, dpr) is rendered once into
+    ``QPixmapCache``; hover / press / enable changes then cost one pixmap
+    blit plus the label, with no stylesheet background pass.
+    """
+
+    _FILL = {
+        "normal":   QColor("#2688EB"),
+        "hover":    QColor("#1A75D2"),
+        "pressed":  QColor("#1565B5"),
+        "disabled": QColor("#B0C4DE"),
+    }
+
+    def __init__(self, text: str, parent: Optional[QWidget] = None) -> None:
+        super().__init__(text, parent)
+        self.setFont(_font(14, bold=True))
+        self.setMinimumHeight(42)
+        self.setAttribute(Qt.WA_Hover, True)
+
+    def sizeHint(self) -> QSize:  # noqa: N802
+        hint = self.fontMetrics().size(Qt.TextSingleLine, self.text())
+        return QSize(hint.width() + 32, max(42, hint.height() + 24))
+
+    def _state(self) -> str:
+        if not self.isEnabled():
+            return "disabled"
+        if self.isDown():
+            return "pressed"
+        return "hover" if self.underMouse() else "normal"
+
+    def _background(self, state: str) -> QPixmap:
+        dpr = self.devicePixelRatioF()
+        size = self.size()
+        key = f"slice-btn-{size.width()}x{size.height()}-{state}-{dpr}"
+        pm = QPixmapCache.find(key)
+        if pm is None or pm.isNull():
+            pm = QPixmap(size * dpr)
+            pm.setDevicePixelRatio(dpr)
+            pm.fill(Qt.transparent)
+            p = QPainter(pm)
+            p.setRenderHint(QPainter.Antialiasing)
+            p.setPen(Qt.NoPen)
+            p.setBrush(self._FILL[state])
+            p.drawRoundedRect(QRect(QPoint(0, 0), size), 5, 5)
+            p.end()
+            QPixmapCache.insert(key, pm)
+        return pm
+
+    def paintEvent(self, event) -> None:  # noqa: N802
+        state = self._state()
+        p = QPainter(self)
+        p.drawPixmap(0, 0, self._background(state))
+        p.setPen(QColor("#F0F0F0" if state == "disabled" else "#FFFFFF"))
+        p.setFont(self.font())
+        p.drawText(self.rect(), _ALIGN_CENTER, self.text())
+        p.end()
+
+    def enterEvent(self, event) -> None:  # noqa: N802
+        self.update()
+        super().enterEvent(event)
+
+    def leaveEvent(self, event) -> None:  # noqa: N802
+        self.update()
+        super().leaveEvent(event)
+
+
+# ======================================================================
+#  Central widget with painted dividers
+# ======================================================================
+
+class SeparatorCentralWidget(QWidget):
+    """Central widget that draws the 1 px panel dividers itself.
+
+    Register a descendant and the edge it should be separated on with
+    ``add_separator``; the layouts leave a 1 px gap there and a single
+    ``paintEvent`` draws every divider in one ``drawLines`` call, instead
+    of each panel's QSS ``border-*`` being painted as its own frame.
+    """
+
+    _COLOR = QColor("#D0D0D0")
+
+    def __init__(self, parent: Optional[QWidget] = None) -> None:
+        super().__init__(parent)
+        self._edges: List[Tuple[QWidget, Qt.Edge]] = []
+
+    def add_separator(self, widget: QWidget, edge: Qt.Edge) -> None:
+        self._edges.append((widget, edge))
+        self.update()
+
+    def _lines(self) -> List[QLine]:
+        lines = []
+        for widget, edge in self._edges:
+            if not widget.isVisible():
+                continue
+            g = QRect(widget.mapTo(self, QPoint(0, 0)), widget.size())
+            if edge == Qt.LeftEdge:
+                lines.append(QLine(g.left() - 1, g.top(), g.left() - 1, g.bottom()))
+            elif edge == Qt.RightEdge:
+                lines.append(QLine(g.right() + 1, g.top(), g.right() + 1, g.bottom()))
+            elif edge == Qt.TopEdge:
+                lines.append(QLine(g.left(), g.top() - 1, g.right(), g.top() - 1))
+            else:
+                lines.append(QLine(g.left(), g.bottom() + 1, g.right(), g.bottom() + 1))
+        return lines
+
+    def paintEvent(self, event) -> None:  # noqa: N802
+        p = QPainter(self)
+        p.setPen(self._COLOR)
+        p.drawLines(self._lines())
+        p.end()
 
 
 # ======================================================================
@@ -333,9 +759,22 @@ class SlicerGUI(QMainWindow):
         self.slicer = slicer_service
         self.loader = asset_loader
 
-        self._slicing_thread: Optional[SlicingThread] = None
+        self._slicing_job: Optional[SlicingRunnable] = None
+        self._load_job: Optional[MeshLoadRunnable] = None
         self._current_stage = self.STAGE_PREPARE
 
+        # The slicing job only records its latest progress; this timer
+        # copies it to the progress widgets every _PROGRESS_POLL_MS.
+        self._progress_timer = QTimer(self)
+        self._progress_timer.setInterval(_PROGRESS_POLL_MS)
+        self._progress_timer.timeout.connect(self._poll_progress)
+        self._last_pct = 0
+        self._last_msg = ""
+        # Last text pushed to each Print Setup value label (see _set_text).
+        self._last_param_strs: Dict[str, str] = {}
+        # Menu actions by name (see _add_action); owned by this window.
+        self._actions: Dict[str, QAction] = {}
+
         self._current_params: dict = {
             "layer_thickness": 0.030,
             "laser_power": 200.0,
@@ -349,11 +788,30 @@ class SlicerGUI(QMainWindow):
         self.setWindowTitle("PySLM Industrial Slicer")
         self.setMinimumSize(1100, 700)
         self.resize(1440, 900)
-        self.setStyleSheet(_STYLESHEET)
-
-        self._build_ui()
-        self._create_menu_bar()
-        self._create_status_bar()
+        apply_app_stylesheet()      # no-op if the bootstrap already did it
+
+        # Only the header, tool sidebar and viewport are built up front; the
+        # Print Setup panel and object list follow once the window has been
+        # shown and the menus once the event loop is running.  Painting
+        # stays frozen while the widget tree is assembled.
+        self._heavy_initialized = False
+        self.setUpdatesEnabled(False)
+        try:
+            self._build_minimal_ui()
+            self._create_status_bar()
+        finally:
+            self.setUpdatesEnabled(True)
+        # All object names are set by now: resolve the sheet for the tree
+        # in one pass rather than widget by widget as each is first shown.
+        self.ensurePolished()
+        QTimer.singleShot(0, self._create_menu_bar)
+
+        # Edits request a viewport rebuild; several requests made within
+        # one event-loop pass collapse into a single rebuild_scene().
+        self._rebuild_timer = QTimer(self)
+        self._rebuild_timer.setSingleShot(True)
+        self._rebuild_timer.setInterval(0)
+        self._rebuild_timer.timeout.connect(self.viewport.rebuild_scene)
 
         # Deferred first render (after Qt event-loop tick)
         QTimer.singleShot(100, self._initial_scene_load)
@@ -362,7 +820,30 @@ class SlicerGUI(QMainWindow):
     #  Deferred init
     # ------------------------------------------------------------------
 
+    def showEvent(self, event) -> None:  # noqa: N802
+        super().showEvent(event)
+        # Let the first frame go out with the minimal UI; the rest is built
+        # on the next event-loop pass.
+        if not self._heavy_initialized:
+            QTimer.singleShot(0, self._ensure_heavy_ui)
+
+    def _ensure_heavy_ui(self) -> None:
+        if self._heavy_initialized:
+            return
+        self._heavy_initialized = True
+        self.setUpdatesEnabled(False)
+        try:
+            self._build_heavy_ui()
+        finally:
+            self.setUpdatesEnabled(True)
+
+    def _request_rebuild(self) -> None:
+        """Schedule one viewport rebuild for the next event-loop pass."""
+        if not self._rebuild_timer.isActive():
+            self._rebuild_timer.start()
+
     def _initial_scene_load(self) -> None:
+        self._ensure_heavy_ui()
         self.viewport.rebuild_scene()
         self._refresh_object_list()
         self._update_param_display()
@@ -371,8 +852,8 @@ class SlicerGUI(QMainWindow):
     #  UI Construction
     # ==================================================================
 
-    def _build_ui(self) -> None:
-        central = QWidget()
+    def _build_minimal_ui(self) -> None:
+        central = SeparatorCentralWidget()
         self.setCentralWidget(central)
         root = QVBoxLayout(central)
         root.setContentsMargins(0, 0, 0, 0)
@@ -381,29 +862,48 @@ class SlicerGUI(QMainWindow):
         # ---- Header bar (dark) ----
         root.addWidget(self._build_header())
 
-        # ---- Content: tools | viewport | panel ----
-        content = QWidget()
-        content_lay = QHBoxLayout(content)
-        content_lay.setContentsMargins(0, 0, 0, 0)
-        content_lay.setSpacing(0)
-
-        content_lay.addWidget(self._build_tool_sidebar())
-
-        # Viewport + object list
-        vp_area = QWidget()
-        vp_lay = QVBoxLayout(vp_area)
-        vp_lay.setContentsMargins(0, 0, 0, 0)
-        vp_lay.setSpacing(0)
+        # ---- Content: one grid for tools | viewport / object list | panel ----
+        grid = QGridLayout()
+        grid.setContentsMargins(0, 0, 0, 0)
+        grid.setSpacing(1)      # 1 px gaps for the painted dividers
 
-        self.viewport = SLMViewport(self.scene, parent=vp_area)
+        self.viewport = SLMViewport(self.scene, parent=central)
         self.viewport.object_selected.connect(self._on_object_selected)
-        vp_lay.addWidget(self.viewport, stretch=1)
-        vp_lay.addWidget(self._build_object_list())
-
-        content_lay.addWidget(vp_area, stretch=1)
-        content_lay.addWidget(self._build_print_setup_panel())
-
-        root.addWidget(content, stretch=1)
+        # VTK repaints every pixel of the viewport itself: tell Qt not to
+        # erase or blend a background underneath it first.
+        self.viewport.setAttribute(Qt.WA_OpaquePaintEvent, True)
+        self.viewport.setAttribute(Qt.WA_NoSystemBackground, True)
+        self.viewport.setAutoFillBackground(False)
+        # Keep mouse moves over the 3D view from bubbling up to the styled
+        # containers around it.
+        self.viewport.setAttribute(Qt.WA_NoMousePropagation, True)
+        grid.addWidget(self.viewport, 0, 1)
+
+        # Built after the viewport: the camera-preset strip connects to it.
+        sidebar = self._build_tool_sidebar()
+        grid.addWidget(sidebar, 0, 0, 2, 1)
+
+        grid.setColumnStretch(1, 1)
+        grid.setRowStretch(0, 1)
+        root.addLayout(grid, stretch=1)
+        self._grid = grid
+
+        central.add_separator(sidebar, Qt.RightEdge)
+        _disable_hover(central)
+
+    def _build_heavy_ui(self) -> None:
+        """Object list and Print Setup panel, built after the first show."""
+        central = self.centralWidget()
+
+        object_list = self._build_object_list()
+        self._grid.addWidget(object_list, 1, 1)
+
+        panel = self._build_print_setup_panel()
+        self._grid.addWidget(panel, 0, 2, 2, 1)
+
+        central.add_separator(object_list, Qt.TopEdge)
+        central.add_separator(panel, Qt.LeftEdge)
+        _disable_hover(central)
 
     # ------------------------------------------------------------------
     #  Header bar
@@ -419,6 +919,7 @@ class SlicerGUI(QMainWindow):
         # Logo
         logo = QLabel("  PySLM  Slicer")
         logo.setObjectName("LogoLabel")
+        logo.setFont(_font(15, bold=True))
         lay.addWidget(logo)
         lay.addSpacing(28)
 
@@ -426,18 +927,17 @@ class SlicerGUI(QMainWindow):
         self._stage_group = QButtonGroup(bar)
         self._stage_group.setExclusive(True)
 
-        self.btn_prepare = QPushButton("PREPARE")
-        self.btn_prepare.setObjectName("StageTab")
-        self.btn_prepare.setCheckable(True)
+        self.btn_prepare, self.btn_preview = _make_buttons(bar, [
+            ("PREPARE", "StageTab", ""),
+            ("PREVIEW", "StageTab", ""),
+        ])
         self.btn_prepare.setChecked(True)
-        self._stage_group.addButton(self.btn_prepare, self.STAGE_PREPARE)
-        lay.addWidget(self.btn_prepare)
-
-        self.btn_preview = QPushButton("PREVIEW")
-        self.btn_preview.setObjectName("StageTab")
-        self.btn_preview.setCheckable(True)
-        self._stage_group.addButton(self.btn_preview, self.STAGE_PREVIEW)
-        lay.addWidget(self.btn_preview)
+        for btn, stage in ((self.btn_prepare, self.STAGE_PREPARE),
+                           (self.btn_preview, self.STAGE_PREVIEW)):
+            btn.setFont(_font(12, bold=True))
+            _use_fast_style(btn)
+            self._stage_group.addButton(btn, stage)
+            lay.addWidget(btn)
 
         self._stage_group.idClicked.connect(self._on_stage_changed)
 
@@ -447,6 +947,8 @@ class SlicerGUI(QMainWindow):
         lay.addWidget(self._header_label("Machine:"))
         self.machine_combo = QComboBox()
         self.machine_combo.setObjectName("HeaderCombo")
+        self.machine_combo.setFont(_font(12))
+        _use_fast_style(self.machine_combo)
         self.machine_combo.addItems(["EOS M290", "SLM 280", "Concept Laser M2"])
         lay.addWidget(self.machine_combo)
         lay.addSpacing(12)
@@ -455,9 +957,13 @@ class SlicerGUI(QMainWindow):
         lay.addWidget(self._header_label("Material:"))
         self.material_combo = QComboBox()
         self.material_combo.setObjectName("HeaderCombo")
-        from src.application.slicer_service import MATERIAL_PRESETS
+        self.material_combo.setFont(_font(12))
+        _use_fast_style(self.material_combo)
+        self.material_combo.currentTextChanged.connect(
+            partial(self._on_header_preset_changed, "Material"))
+        self.material_combo.blockSignals(True)
         self.material_combo.addItems(list(MATERIAL_PRESETS.keys()))
-        self.material_combo.currentTextChanged.connect(self._on_material_header_changed)
+        self.material_combo.blockSignals(False)
         lay.addWidget(self.material_combo)
         lay.addSpacing(12)
 
@@ -465,18 +971,29 @@ class SlicerGUI(QMainWindow):
         lay.addWidget(self._header_label("Profile:"))
         self.profile_combo = QComboBox()
         self.profile_combo.setObjectName("HeaderCombo")
-        from src.application.slicer_service import PROFILE_PRESETS
+        self.profile_combo.setFont(_font(12))
+        _use_fast_style(self.profile_combo)
+        self.profile_combo.currentTextChanged.connect(
+            partial(self._on_header_preset_changed, "Profile"))
+        self.profile_combo.blockSignals(True)
         self.profile_combo.addItems(list(PROFILE_PRESETS.keys()))
         self.profile_combo.setCurrentIndex(1)  # Normal
-        self.profile_combo.currentTextChanged.connect(self._on_profile_header_changed)
+        self.profile_combo.blockSignals(False)
         lay.addWidget(self.profile_combo)
 
+        # Apply the initial profile once, without the slot's label refresh:
+        # the Print Setup labels do not exist yet and pick the value up in
+        # _initial_scene_load.
+        self._current_params["layer_thickness"] = \
+            PROFILE_PRESETS[self.profile_combo.currentText()]
+
         return bar
 
     @staticmethod
     def _header_label(text: str) -> QLabel:
         lbl = QLabel(text)
-        lbl.setStyleSheet("color: #9DA5B4; font-size: 11px; padding: 0 4px;")
+        lbl.setStyleSheet("color: #9DA5B4; padding: 0 4px;")
+        lbl.setFont(_font(11))
         return lbl
 
     # ------------------------------------------------------------------
@@ -494,18 +1011,15 @@ class SlicerGUI(QMainWindow):
         self._tool_group.setExclusive(True)
 
         tools = [
-            ("\u2725", "Move (T)",    0),   # ✥
-            ("\u2B21", "Scale (S)",   1),   # ⬡
-            ("\u27F2", "Rotate (R)",  2),   # ⟲
-            ("\u21D4", "Mirror (M)",  3),   # ⇔
+            ("\u2725", "", "Move (T)"),     # ✥
+            ("\u2B21", "", "Scale (S)"),    # ⬡
+            ("\u27F2", "", "Rotate (R)"),   # ⟲
+            ("\u21D4", "", "Mirror (M)"),   # ⇔
         ]
-        for icon, tip, tid in tools:
-            btn = QPushButton(icon)
-            btn.setProperty("class", "ToolBtn")
-            btn.setCheckable(True)
-            btn.setToolTip(tip)
+        for tid, btn in enumerate(_make_buttons(sidebar, tools, "ToolBtn")):
+            btn.setFont(_font(16))
             self._tool_group.addButton(btn, tid)
-            lay.addWidget(btn, alignment=Qt.AlignHCenter)
+            lay.addWidget(btn, alignment=_ALIGN_HCENTER)
 
         self._tool_group.idClicked.connect(self._on_tool_changed)
 
@@ -518,20 +1032,9 @@ class SlicerGUI(QMainWindow):
         lay.addWidget(sep)
         lay.addSpacing(4)
 
-        grid = QGridLayout()
-        grid.setSpacing(2)
-        views = [
-            ("F", "front", 0, 0), ("T", "top",   0, 1),
-            ("L", "left",  1, 0), ("R", "right", 1, 1),
-            ("I", "iso",   2, 0), ("B", "back",  2, 1),
-        ]
-        for label, direction, r, c in views:
-            btn = QPushButton(label)
-            btn.setProperty("class", "ViewBtn")
-            btn.setToolTip(f"{direction.capitalize()} view")
-            btn.clicked.connect(lambda _=False, d=direction: self.viewport.set_view(d))
-            grid.addWidget(btn, r, c)
-        lay.addLayout(grid)
+        views = ViewControlStrip(sidebar)
+        views.viewSelected.connect(self.viewport.set_view)
+        lay.addWidget(views, alignment=_ALIGN_HCENTER)
         lay.addSpacing(4)
 
         return sidebar
@@ -549,15 +1052,26 @@ class SlicerGUI(QMainWindow):
 
         self._obj_toggle = QPushButton("\u25BC  Objects (0)")
         self._obj_toggle.setObjectName("ObjectListToggle")
-        self._obj_toggle.setCursor(Qt.PointingHandCursor)
+        self._obj_toggle.setFont(_font(12, bold=True))
+        self._obj_toggle.setCursor(_POINTING_CURSOR)
         self._obj_toggle.clicked.connect(self._toggle_object_list)
+        _use_fast_style(self._obj_toggle)
         lay.addWidget(self._obj_toggle)
 
         self.scene_tree = QTreeWidget()
         self.scene_tree.setHeaderLabels(["Name", "Triangles"])
+        self.scene_tree.setFont(_font(12))
         self.scene_tree.setColumnWidth(0, 160)
+        # Flat, fixed-height list: lets the view skip per-row size hints
+        # and header auto-resizing when items change.
         self.scene_tree.setRootIsDecorated(False)
+        self.scene_tree.setUniformRowHeights(True)
+        self.scene_tree.setItemsExpandable(False)
+        self.scene_tree.setAllColumnsShowFocus(True)
+        self.scene_tree.header().setSectionResizeMode(QHeaderView.Fixed)
         self.scene_tree.setSelectionMode(QTreeWidget.SingleSelection)
+        self.scene_tree.setItemDelegate(_CachedRowDelegate(self.scene_tree))
+        self._tree_items: Dict[str, QTreeWidgetItem] = {}
         self.scene_tree.itemClicked.connect(self._on_tree_item_clicked)
         self.scene_tree.setMaximumHeight(120)
         lay.addWidget(self.scene_tree)
@@ -584,9 +1098,10 @@ class SlicerGUI(QMainWindow):
 
         title = QLabel("Print Setup")
         title.setObjectName("PanelTitle")
+        title.setFont(_font(15, bold=True))
         outer.addWidget(title)
 
-        scroll = QScrollArea()
+        scroll = SectionScrollArea()
         scroll.setWidgetResizable(True)
         scroll.setHorizontalScrollBarPolicy(Qt.ScrollBarAlwaysOff)
 
@@ -600,6 +1115,7 @@ class SlicerGUI(QMainWindow):
         self.lbl_layer = QLabel(self._fmt_lt())
         sec_qual.add_row("Layer thickness:", self.lbl_layer)
         self._panel_lay.addWidget(sec_qual)
+        scroll.add_section(sec_qual)
 
         # ---- Material section ----
         sec_mat = CollapsibleSection("Material")
@@ -609,6 +1125,7 @@ class SlicerGUI(QMainWindow):
         btn_mat.clicked.connect(self._on_material_library)
         sec_mat.add_widget(btn_mat)
         self._panel_lay.addWidget(sec_mat)
+        scroll.add_section(sec_mat)
 
         # ---- Process Parameters section ----
         sec_params = CollapsibleSection("Process Parameters")
@@ -633,18 +1150,16 @@ class SlicerGUI(QMainWindow):
         btn_edit.clicked.connect(self._on_edit_settings)
         sec_params.add_widget(btn_edit)
         self._panel_lay.addWidget(sec_params)
+        scroll.add_section(sec_params)
 
-        # ---- Build Plate section ----
-        sec_plate = CollapsibleSection("Build Plate")
-        self.lbl_plate = QLabel(
-            f"\u2300 {self.scene.build_plate.diameter_mm:.0f} mm  \u00D7  "
-            f"{self.scene.build_plate.height_mm:.0f} mm"
+        # ---- Build Plate section (contents built on first expand) ----
+        self.lbl_plate: Optional[QLabel] = None
+        sec_plate = CollapsibleSection(
+            "Build Plate", content_builder=self._fill_plate_section,
+            collapsed=True,
         )
-        sec_plate.add_row("Dimensions:", self.lbl_plate)
-        btn_plate = QPushButton("Configure\u2026")
-        btn_plate.clicked.connect(self._on_build_plate_config)
-        sec_plate.add_widget(btn_plate)
         self._panel_lay.addWidget(sec_plate)
+        scroll.add_section(sec_plate)
 
         self._panel_lay.addStretch()
 
@@ -656,27 +1171,30 @@ class SlicerGUI(QMainWindow):
 
         # Build-time estimate
         self.lbl_estimate = QLabel("")
-        self.lbl_estimate.setStyleSheet("color: #737373; font-size: 12px;")
-        self.lbl_estimate.setAlignment(Qt.AlignCenter)
+        self.lbl_estimate.setStyleSheet("color: #737373;")
+        self.lbl_estimate.setFont(_font(12))
+        self.lbl_estimate.setAlignment(_ALIGN_CENTER)
         action_lay.addWidget(self.lbl_estimate)
 
         # Progress bar
         self.progress_bar = QProgressBar()
         self.progress_bar.setRange(0, 100)
+        self.progress_bar.setFont(_font(11))
         self.progress_bar.setValue(0)
         self.progress_bar.setVisible(False)
         action_lay.addWidget(self.progress_bar)
 
         self.progress_label = QLabel("")
-        self.progress_label.setStyleSheet("color: #555; font-size: 11px;")
-        self.progress_label.setAlignment(Qt.AlignCenter)
+        self.progress_label.setStyleSheet("color: #555;")
+        self.progress_label.setFont(_font(11))
+        self.progress_label.setAlignment(_ALIGN_CENTER)
         self.progress_label.setVisible(False)
         action_lay.addWidget(self.progress_label)
 
         # Slice button
-        self.slice_btn = QPushButton("Slice")
+        self.slice_btn = CachedSliceButton("Slice")
         self.slice_btn.setObjectName("SliceButton")
-        self.slice_btn.setCursor(Qt.PointingHandCursor)
+        self.slice_btn.setCursor(_POINTING_CURSOR)
         self.slice_btn.clicked.connect(self._on_slice)
         action_lay.addWidget(self.slice_btn)
 
@@ -686,62 +1204,53 @@ class SlicerGUI(QMainWindow):
         outer.addWidget(scroll, stretch=1)
         return wrapper
 
+    def _fill_plate_section(self, sec: CollapsibleSection) -> None:
+        self.lbl_plate = QLabel(self._fmt_plate())
+        sec.add_row("Dimensions:", self.lbl_plate)
+        btn_plate = QPushButton("Configure\u2026")
+        btn_plate.clicked.connect(self._on_build_plate_config)
+        sec.add_widget(btn_plate)
+
     # ------------------------------------------------------------------
     #  Menu bar
     # ------------------------------------------------------------------
 
     def _create_menu_bar(self) -> None:
         mb = self.menuBar()
+        mb.setFont(_font(13))
+        add = self._add_action
 
         # ---- File ----
         fm = mb.addMenu("&File")
-        act = QAction("&Open STL / 3MF\u2026", self)
-        act.setShortcut(QKeySequence.Open)
-        act.triggered.connect(self._on_open_file)
-        fm.addAction(act)
+        add(fm, "file.open", "&Open STL / 3MF\u2026", self._on_open_file,
+            QKeySequence.Open)
         fm.addSeparator()
-        act = QAction("&Save Project\u2026", self)
-        act.setShortcut(QKeySequence.Save)
-        act.triggered.connect(self._on_save_project)
-        fm.addAction(act)
-        act = QAction("Export &CLI\u2026", self)
-        act.triggered.connect(self._on_export_cli)
-        fm.addAction(act)
+        add(fm, "file.save", "&Save Project\u2026", self._on_save_project,
+            QKeySequence.Save)
+        add(fm, "file.export_cli", "Export &CLI\u2026", self._on_export_cli)
         fm.addSeparator()
-        act = QAction("&Quit", self)
-        act.setShortcut(QKeySequence("Ctrl+Q"))
-        act.triggered.connect(self.close)
-        fm.addAction(act)
+        add(fm, "file.quit", "&Quit", self.close, QKeySequence("Ctrl+Q"))
 
         # ---- Edit ----
         em = mb.addMenu("&Edit")
-        act = QAction("&Undo", self)
-        act.setShortcut(QKeySequence.Undo)
-        act.triggered.connect(self._on_undo)
-        em.addAction(act)
-        act = QAction("&Redo", self)
-        act.setShortcut(QKeySequence.Redo)
-        act.triggered.connect(self._on_redo)
-        em.addAction(act)
+        add(em, "edit.undo", "&Undo", self._on_undo, QKeySequence.Undo)
+        add(em, "edit.redo", "&Redo", self._on_redo, QKeySequence.Redo)
         em.addSeparator()
-        act = QAction("&Delete Selected", self)
-        act.setShortcut(QKeySequence.Delete)
-        act.triggered.connect(self._on_delete_selected)
-        em.addAction(act)
-        act = QAction("Du&plicate", self)
-        act.setShortcut(QKeySequence("Ctrl+D"))
-        act.triggered.connect(self._on_duplicate)
-        em.addAction(act)
+        add(em, "edit.delete", "&Delete Selected", self._on_delete_selected,
+            QKeySequence.Delete)
+        add(em, "edit.duplicate", "Du&plicate", self._on_duplicate,
+            QKeySequence("Ctrl+D"))
         em.addSeparator()
-        act = QAction("Select &All", self)
-        act.setShortcut(QKeySequence.SelectAll)
-        em.addAction(act)
-        act = QAction("&Arrange All on Build Plate", self)
-        act.triggered.connect(self._on_arrange_all)
-        em.addAction(act)
+        add(em, "edit.select_all", "Select &All", None,
+            QKeySequence.SelectAll)
+        add(em, "edit.arrange", "&Arrange All on Build Plate",
+            self._on_arrange_all)
 
         # ---- View ----
         vm = mb.addMenu("&View")
+        # One mapper routes every camera-preset action to set_view(direction).
+        self._view_mapper = QSignalMapper(self)
+        self._view_mapper.mappedString.connect(self.viewport.set_view)
         for name, key, direction in [
             ("Front",     "Ctrl+1", "front"),
             ("Top",       "Ctrl+2", "top"),
@@ -749,41 +1258,40 @@ class SlicerGUI(QMainWindow):
             ("Right",     "Ctrl+4", "right"),
             ("Isometric", "Ctrl+5", "iso"),
         ]:
-            a = QAction(f"{name} View", self)
-            a.setShortcut(QKeySequence(key))
-            a.triggered.connect(lambda _=False, d=direction: self.viewport.set_view(d))
-            vm.addAction(a)
+            act = add(vm, f"view.{direction}", f"{name} View",
+                      self._view_mapper.map, QKeySequence(key))
+            self._view_mapper.setMapping(act, direction)
         vm.addSeparator()
-        act = QAction("&Fit All", self)
-        act.setShortcut(QKeySequence("F"))
-        act.triggered.connect(self.viewport.fit_to_scene)
-        vm.addAction(act)
-        act = QAction("&Reset Camera", self)
-        act.setShortcut(QKeySequence("Home"))
-        act.triggered.connect(self.viewport.reset_view)
-        vm.addAction(act)
+        add(vm, "view.fit", "&Fit All", self.viewport.fit_to_scene,
+            QKeySequence("F"))
+        add(vm, "view.reset", "&Reset Camera", self.viewport.reset_view,
+            QKeySequence("Home"))
 
         # ---- Slicer ----
         sm = mb.addMenu("&Slicer")
-        act = QAction("&Settings\u2026", self)
-        act.triggered.connect(self._on_edit_settings)
-        sm.addAction(act)
-        act = QAction("&Material Library\u2026", self)
-        act.triggered.connect(self._on_material_library)
-        sm.addAction(act)
-        act = QAction("&Quality Profiles\u2026", self)
-        act.triggered.connect(self._on_quality_profiles)
-        sm.addAction(act)
+        add(sm, "slicer.settings", "&Settings\u2026", self._on_edit_settings)
+        add(sm, "slicer.materials", "&Material Library\u2026",
+            self._on_material_library)
+        add(sm, "slicer.profiles", "&Quality Profiles\u2026",
+            self._on_quality_profiles)
         sm.addSeparator()
-        act = QAction("&Build Plate\u2026", self)
-        act.triggered.connect(self._on_build_plate_config)
-        sm.addAction(act)
+        add(sm, "slicer.build_plate", "&Build Plate\u2026",
+            self._on_build_plate_config)
 
         # ---- Help ----
         hm = mb.addMenu("&Help")
-        act = QAction("&About PySLM Slicer\u2026", self)
-        act.triggered.connect(self._on_about)
-        hm.addAction(act)
+        add(hm, "help.about", "&About PySLM Slicer\u2026", self._on_about)
+
+    def _add_action(self, menu, name: str, text: str,
+                    slot: Optional[Callable] = None, shortcut=None) -> QAction:
+        act = QAction(text, self)
+        if shortcut is not None:
+            act.setShortcut(shortcut)
+        if slot is not None:
+            act.triggered.connect(slot)
+        menu.addAction(act)
+        self._actions[name] = act
+        return act
 
     # ------------------------------------------------------------------
     #  Status bar
@@ -791,6 +1299,8 @@ class SlicerGUI(QMainWindow):
 
     def _create_status_bar(self) -> None:
         self.status_bar = QStatusBar()
+        self.status_bar.setFont(_font(12))
+        self.status_bar.setAttribute(Qt.WA_Hover, False)
         self.setStatusBar(self.status_bar)
         self.status_bar.showMessage("Ready", 5000)
 
@@ -804,21 +1314,47 @@ class SlicerGUI(QMainWindow):
             self, "Open 3D Model", str(Path.home()),
             "3D Models (*.stl *.STL *.3mf *.obj *.amf);;All Files (*.*)",
         )
-        if not path:
+        if not path or self._load_job is not None:
             return
-        try:
-            self.status_bar.showMessage(f"Loading {Path(path).name}\u2026")
-            name, mesh = self.loader.load(path)
-            self.scene.add_mesh(name, mesh, source_path=path)
-            self._refresh_object_list()
-            self.viewport.rebuild_scene()
-            self.status_bar.showMessage(
-                f"Loaded {name}  ({mesh.faces.shape[0]:,} triangles)", 5000,
-            )
-        except Exception as exc:
-            QMessageBox.critical(self, "Load Error",
-                                 f"Failed to load file:\n{exc}")
-            self.status_bar.showMessage("Load failed", 5000)
+
+        # Parse on a pool thread; the scene is only touched from the
+        # completion slots, back on the UI thread.
+        job = MeshLoadRunnable(self.loader, path)
+        job.signals.loaded.connect(self._on_mesh_loaded, Qt.QueuedConnection)
+        job.signals.failed.connect(self._on_mesh_load_failed,
+                                   Qt.QueuedConnection)
+        self._load_job = job
+        self._set_loading(True)
+        self.status_bar.showMessage(f"Loading {Path(path).name}\u2026")
+        QThreadPool.globalInstance().start(job)
+
+    def _set_loading(self, loading: bool) -> None:
+        act = self._actions.get("file.open")
+        if act is not None:
+            act.setEnabled(not loading)
+        # The progress bar is shared with slicing; leave it to a running slice.
+        if self._slicing_job is None:
+            self.progress_bar.setRange(0, 0 if loading else 100)
+            self.progress_bar.setVisible(loading)
+        if not loading:
+            self._load_job = None
+
+    @Slot(str, object, str)
+    def _on_mesh_loaded(self, name: str, mesh, path: str) -> None:
+        self._set_loading(False)
+        self.scene.add_mesh(name, mesh, source_path=path)
+        self._refresh_object_list()
+        self._request_rebuild()
+        self.status_bar.showMessage(
+            f"Loaded {name}  ({mesh.faces.shape[0]:,} triangles)", 5000,
+        )
+
+    @Slot(str)
+    def _on_mesh_load_failed(self, err: str) -> None:
+        self._set_loading(False)
+        QMessageBox.critical(self, "Load Error",
+                             f"Failed to load file:\n{err}")
+        self.status_bar.showMessage("Load failed", 5000)
 
     @Slot()
     def _on_save_project(self) -> None:
@@ -874,7 +1410,7 @@ class SlicerGUI(QMainWindow):
     def _on_undo(self) -> None:
         label = self.scene.perform_undo()
         if label:
-            self.viewport.rebuild_scene()
+            self._request_rebuild()
             self.status_bar.showMessage(f"Undo: {label}", 3000)
         else:
             self.status_bar.showMessage("Nothing to undo", 3000)
@@ -883,7 +1419,7 @@ class SlicerGUI(QMainWindow):
     def _on_redo(self) -> None:
         label = self.scene.perform_redo()
         if label:
-            self.viewport.rebuild_scene()
+            self._request_rebuild()
             self.status_bar.showMessage(f"Redo: {label}", 3000)
         else:
             self.status_bar.showMessage("Nothing to redo", 3000)
@@ -892,7 +1428,7 @@ class SlicerGUI(QMainWindow):
     def _on_delete_selected(self) -> None:
         if self.scene.remove_selected():
             self._refresh_object_list()
-            self.viewport.rebuild_scene()
+            self._request_rebuild()
             self.status_bar.showMessage("Object deleted", 3000)
 
     @Slot()
@@ -900,13 +1436,13 @@ class SlicerGUI(QMainWindow):
         obj = self.scene.duplicate_selected()
         if obj:
             self._refresh_object_list()
-            self.viewport.rebuild_scene()
+            self._request_rebuild()
             self.status_bar.showMessage(f"Duplicated: {obj.name}", 3000)
 
     @Slot()
     def _on_arrange_all(self) -> None:
         self.scene.auto_arrange()
-        self.viewport.rebuild_scene()
+        self._request_rebuild()
         self.status_bar.showMessage("Objects arranged on build plate", 3000)
 
     # ==================================================================
@@ -915,7 +1451,7 @@ class SlicerGUI(QMainWindow):
 
     @Slot()
     def _on_edit_settings(self) -> None:
-        dlg = SettingsDialog(self._current_params, self)
+        dlg = shared_dialog(SettingsDialog, self._current_params, parent=self)
         if dlg.exec() == SettingsDialog.Accepted:
             self._current_params = dlg.get_params()
             self._update_param_display()
@@ -923,11 +1459,10 @@ class SlicerGUI(QMainWindow):
 
     @Slot()
     def _on_material_library(self) -> None:
-        dlg = MaterialDialog(self)
+        dlg = shared_dialog(MaterialDialog, parent=self)
         if dlg.exec() == MaterialDialog.Accepted and dlg.selected_material:
-            from src.application.slicer_service import MATERIAL_PRESETS
             self._current_params.update(MATERIAL_PRESETS[dlg.selected_material])
-            self.lbl_material.setText(dlg.selected_material)
+            self._set_text("material", self.lbl_material, dlg.selected_material)
             idx = self.material_combo.findText(dlg.selected_material)
             if idx >= 0:
                 self.material_combo.blockSignals(True)
@@ -940,9 +1475,8 @@ class SlicerGUI(QMainWindow):
 
     @Slot()
     def _on_quality_profiles(self) -> None:
-        dlg = ProfileDialog(self)
+        dlg = shared_dialog(ProfileDialog, parent=self)
         if dlg.exec() == ProfileDialog.Accepted and dlg.selected_profile:
-            from src.application.slicer_service import PROFILE_PRESETS
             self._current_params["layer_thickness"] = \
                 PROFILE_PRESETS[dlg.selected_profile]
             idx = self.profile_combo.findText(dlg.selected_profile)
@@ -958,44 +1492,39 @@ class SlicerGUI(QMainWindow):
     @Slot()
     def _on_build_plate_config(self) -> None:
         plate = self.scene.build_plate
-        dlg = BuildPlateDialog(plate.diameter_mm, plate.height_mm, self)
+        dlg = shared_dialog(BuildPlateDialog, plate.diameter_mm,
+                            plate.height_mm, parent=self)
         if dlg.exec() == BuildPlateDialog.Accepted:
             plate.diameter_mm = dlg.diameter
             plate.height_mm = dlg.height
-            self.lbl_plate.setText(
-                f"\u2300 {plate.diameter_mm:.0f} mm  \u00D7  "
-                f"{plate.height_mm:.0f} mm"
-            )
+            if self.lbl_plate is not None:
+                self._set_text("plate", self.lbl_plate, self._fmt_plate())
             self.viewport._create_build_plate()
             self.viewport._create_floor_grid()
-            self.viewport.rebuild_scene()
+            self._request_rebuild()
             self.status_bar.showMessage("Build plate updated", 3000)
 
     @Slot()
     def _on_about(self) -> None:
-        AboutDialog(self).exec()
+        shared_dialog(AboutDialog, parent=self).exec()
 
     # ==================================================================
     #  Slots  --  Header combo changes
     # ==================================================================
 
-    @Slot(str)
-    def _on_material_header_changed(self, material_name: str) -> None:
-        from src.application.slicer_service import MATERIAL_PRESETS
-        if material_name in MATERIAL_PRESETS:
-            self._current_params.update(MATERIAL_PRESETS[material_name])
-            self.lbl_material.setText(material_name)
-            self._update_param_display()
-            self.status_bar.showMessage(f"Material: {material_name}", 3000)
-
-    @Slot(str)
-    def _on_profile_header_changed(self, profile_name: str) -> None:
-        from src.application.slicer_service import PROFILE_PRESETS
-        if profile_name in PROFILE_PRESETS:
-            self._current_params["layer_thickness"] = \
-                PROFILE_PRESETS[profile_name]
-            self._update_param_display()
-            self.status_bar.showMessage(f"Profile: {profile_name}", 3000)
+    def _on_header_preset_changed(self, kind: str, name: str) -> None:
+        """Apply the Material or Profile preset picked in the header bar."""
+        if kind == "Material":
+            if name not in MATERIAL_PRESETS:
+                return
+            self._current_params.update(MATERIAL_PRESETS[name])
+            self._set_text("material", self.lbl_material, name)
+        else:
+            if name not in PROFILE_PRESETS:
+                return
+            self._current_params["layer_thickness"] = PROFILE_PRESETS[name]
+        self._update_param_display()
+        self.status_bar.showMessage(f"{kind}: {name}", 3000)
 
     # ==================================================================
     #  Slots  --  Stage switching
@@ -1033,38 +1562,55 @@ class SlicerGUI(QMainWindow):
                                 "Please load at least one 3D model first.")
             return
 
-        if self._slicing_thread and self._slicing_thread.isRunning():
+        if self._slicing_job is not None:
             QMessageBox.warning(self, "Busy",
                                 "A slicing operation is already running.")
             return
 
         mesh_items = self.scene.collect_for_slicing()
-        self._slicing_thread = SlicingThread(
-            self.slicer, mesh_items, self._current_params, self,
-        )
-        self._slicing_thread.worker.progress_updated.connect(
-            self._on_slice_progress)
-        self._slicing_thread.worker.slicing_finished.connect(
-            self._on_slice_finished)
-        self._slicing_thread.worker.slicing_failed.connect(
-            self._on_slice_failed)
+        job = SlicingRunnable(self.slicer, mesh_items, self._current_params)
+        # The job runs on a pool thread: queue explicitly so the one-shot
+        # completion slots always run on the UI thread.
+        job.signals.slicing_finished.connect(
+            self._on_slice_finished, Qt.QueuedConnection)
+        job.signals.slicing_failed.connect(
+            self._on_slice_failed, Qt.QueuedConnection)
+        self._slicing_job = job
 
         self.slice_btn.setEnabled(False)
         self.slice_btn.setText("Slicing\u2026")
+        self.progress_bar.setRange(0, 100)
         self.progress_bar.setVisible(True)
         self.progress_label.setVisible(True)
         self.progress_bar.setValue(0)
-        self.lbl_estimate.setText("")
+        self.progress_label.setText("")
+        self._last_pct, self._last_msg = 0, ""
+        self._set_text("estimate", self.lbl_estimate, "")
         self.status_bar.showMessage("Slicing started\u2026")
-        self._slicing_thread.start()
+        self._progress_timer.start()
+        QThreadPool.globalInstance().start(job)
 
-    @Slot(int, str)
-    def _on_slice_progress(self, pct: int, msg: str) -> None:
-        self.progress_bar.setValue(pct)
-        self.progress_label.setText(msg)
+    @Slot()
+    def _poll_progress(self) -> None:
+        if self._slicing_job is None:
+            return
+        pct, msg = self._slicing_job.progress()
+        # Most polls land between layer callbacks: skip unchanged values so
+        # they do not restyle and repaint the widgets for nothing.
+        if pct != self._last_pct:
+            self._last_pct = pct
+            self.progress_bar.setValue(pct)
+        if msg != self._last_msg:
+            self._last_msg = msg
+            self.progress_label.setText(msg)
+
+    def _stop_progress_updates(self) -> None:
+        self._progress_timer.stop()
+        self._slicing_job = None
 
     @Slot(dict)
     def _on_slice_finished(self, result: dict) -> None:
+        self._stop_progress_updates()
         self.slice_btn.setEnabled(True)
         self.slice_btn.setText("Slice")
         self.progress_bar.setVisible(False)
@@ -1074,7 +1620,8 @@ class SlicerGUI(QMainWindow):
         elapsed = result.get("elapsed_s", 0)
         est_h = result.get("est_build_time_h", 0)
 
-        self.lbl_estimate.setText(
+        self._set_text(
+            "estimate", self.lbl_estimate,
             f"{layers} layers  \u2022  ~{est_h:.1f} h build time"
         )
 
@@ -1095,6 +1642,7 @@ class SlicerGUI(QMainWindow):
 
     @Slot(str)
     def _on_slice_failed(self, err: str) -> None:
+        self._stop_progress_updates()
         self.slice_btn.setEnabled(True)
         self.slice_btn.setText("Slice")
         self.progress_bar.setVisible(False)
@@ -1128,31 +1676,70 @@ class SlicerGUI(QMainWindow):
     # ==================================================================
 
     def _refresh_object_list(self) -> None:
-        self.scene_tree.clear()
-        for obj in self.scene.objects:
-            item = QTreeWidgetItem([obj.name,
-                                    f"{obj.mesh.faces.shape[0]:,}"])
-            item.setData(0, Qt.UserRole, obj.uid)
-            if obj.selected:
-                item.setSelected(True)
-            self.scene_tree.addTopLevelItem(item)
+        """Sync the tree with the scene, touching only items that changed."""
+        tree = self.scene_tree
+        items = self._tree_items
+        objects = self.scene.objects
+        live = {obj.uid for obj in objects}
+
+        tree.setUpdatesEnabled(False)
+        tree.blockSignals(True)
+        try:
+            for uid in items.keys() - live:
+                item = items.pop(uid)
+                tree.takeTopLevelItem(tree.indexOfTopLevelItem(item))
+
+            for row, obj in enumerate(objects):
+                item = items.get(obj.uid)
+                if item is None:
+                    item = QTreeWidgetItem()
+                    item.setData(0, Qt.UserRole, obj.uid)
+                    tree.insertTopLevelItem(row, item)
+                    items[obj.uid] = item
+                elif tree.indexOfTopLevelItem(item) != row:
+                    tree.takeTopLevelItem(tree.indexOfTopLevelItem(item))
+                    tree.insertTopLevelItem(row, item)
+                if item.text(0) != obj.name:
+                    item.setText(0, obj.name)
+                tris = f"{obj.mesh.faces.shape[0]:,}"
+                if item.text(1) != tris:
+                    item.setText(1, tris)
+                if item.isSelected() != obj.selected:
+                    item.setSelected(obj.selected)
+        finally:
+            tree.blockSignals(False)
+            tree.setUpdatesEnabled(True)
 
         n = self.scene.object_count
         vis = self.scene_tree.isVisible()
         glyph = "\u25BC" if vis else "\u25B6"
         self._obj_toggle.setText(f"{glyph}  Objects ({n})")
 
+    def _set_text(self, key: str, label: QLabel, text: str) -> None:
+        """``label.setText(text)``, skipped when *key* already shows *text*."""
+        if self._last_param_strs.get(key) != text:
+            self._last_param_strs[key] = text
+            label.setText(text)
+
     def _update_param_display(self) -> None:
         p = self._current_params
-        self.lbl_layer.setText(self._fmt_lt())
-        self.param_labels["laser_power"].setText(f"{p['laser_power']:.1f} W")
-        self.param_labels["scan_speed"].setText(f"{p['scan_speed']:.1f} mm/s")
-        self.param_labels["hatch_spacing"].setText(
-            f"{p['hatch_spacing']:.3f} mm")
-        self.param_labels["hatch_angle"].setText(
-            f"{p['hatch_angle_increment']:.1f}\u00B0")
-        self.param_labels["contour_count"].setText(
-            str(int(p.get("contour_count", 1))))
+        labels = self.param_labels
+        self._set_text("layer", self.lbl_layer, self._fmt_lt())
+        self._set_text("laser_power", labels["laser_power"],
+                       f"{p['laser_power']:.1f} W")
+        self._set_text("scan_speed", labels["scan_speed"],
+                       f"{p['scan_speed']:.1f} mm/s")
+        self._set_text("hatch_spacing", labels["hatch_spacing"],
+                       f"{p['hatch_spacing']:.3f} mm")
+        self._set_text("hatch_angle", labels["hatch_angle"],
+                       f"{p['hatch_angle_increment']:.1f}\u00B0")
+        self._set_text("contour_count", labels["contour_count"],
+                       str(int(p.get("contour_count", 1))))
+
+    def _fmt_plate(self) -> str:
+        plate = self.scene.build_plate
+        return (f"\u2300 {plate.diameter_mm:.0f} mm  \u00D7  "
+                f"{plate.height_mm:.0f} mm")
 
     def _fmt_lt(self) -> str:
         lt_mm = self._current_params["layer_thickness"]
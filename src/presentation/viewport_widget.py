@@ -19,6 +19,19 @@ if TYPE_CHECKING:
     from src.application.scene_manager import SceneManager, SceneObject
 
 
+def _cell_array(idx: np.ndarray) -> np.ndarray:
+    """Flat VTK cell array ``[k, i0 .. ik-1, k, ...]`` for (N, k) indices.
+
+    Filled into one preallocated buffer and returned as a ``ravel`` view,
+    so no intermediate column_stack / flatten copies are made.
+    """
+    n, k = idx.shape
+    cells = np.empty((n, k + 1), dtype=np.int_)
+    cells[:, 0] = k
+    cells[:, 1:] = idx
+    return cells.ravel()
+
+
 class SLMViewport(QtInteractor):
     """
     Industrial 3D viewport for the SLM Slicer.
@@ -46,6 +59,7 @@ class SLMViewport(QtInteractor):
         super().__init__(parent)
         self.scene = scene
         self._mesh_actors: Dict[str, object] = {}
+        self._mesh_data: Dict[str, pv.PolyData] = {}
         self._plate_actors: List[object] = []
         self._selected_actor = None
         self._selected_uid: Optional[str] = None
@@ -138,10 +152,8 @@ class SLMViewport(QtInteractor):
         ring_pts = np.column_stack(
             [r * np.cos(theta), r * np.sin(theta), np.zeros(n_ring + 1)]
         )
-        segs = np.column_stack(
-            [np.full(n_ring, 2), np.arange(n_ring), np.arange(1, n_ring + 1)]
-        )
-        ring = pv.PolyData(ring_pts, lines=segs.ravel())
+        segs = np.column_stack([np.arange(n_ring), np.arange(1, n_ring + 1)])
+        ring = pv.PolyData(ring_pts, lines=_cell_array(segs))
         a3 = self.add_mesh(ring, color="#555555", line_width=2,
                            pickable=False, reset_camera=False)
         self._plate_actors.append(a3)
@@ -151,20 +163,18 @@ class SLMViewport(QtInteractor):
         r = plate.radius
         spacing = 10.0
         pts: list = []
-        segs: list = []
-        idx = 0
 
         for coord in np.arange(-r + spacing, r, spacing):
             half = np.sqrt(max(0.0, r ** 2 - coord ** 2))
             pts += [[coord, -half, 0.02], [coord, half, 0.02]]
-            segs.append([2, idx, idx + 1]); idx += 2
             pts += [[-half, coord, 0.02], [half, coord, 0.02]]
-            segs.append([2, idx, idx + 1]); idx += 2
 
         if pts:
+            # Points were appended in (start, end) pairs, one pair per line.
+            segs = np.arange(len(pts)).reshape(-1, 2)
             grid = pv.PolyData(
                 np.array(pts, dtype=np.float64),
-                lines=np.array(segs, dtype=np.int_).ravel(),
+                lines=_cell_array(segs),
             )
             a = self.add_mesh(grid, color="#B8B8B8", line_width=1,
                               opacity=0.35, pickable=False,
@@ -218,6 +228,7 @@ class SLMViewport(QtInteractor):
             except Exception:
                 pass
         self._mesh_actors.clear()
+        self._mesh_data.clear()
 
         for obj in self.scene.objects:
             if obj.visible:
@@ -227,12 +238,10 @@ class SLMViewport(QtInteractor):
 
     def _add_mesh_actor(self, obj: "SceneObject") -> None:
         tm = obj.transformed_mesh
-        verts = np.asarray(tm.vertices, dtype=np.float64)
-        faces_raw = np.asarray(tm.faces, dtype=np.int_)
-        cells = np.column_stack(
-            [np.full(len(faces_raw), 3), faces_raw]
-        ).ravel()
-        pv_mesh = pv.PolyData(verts, cells)
+        # float32 is what VTK hands to OpenGL anyway; storing it directly
+        # halves the point buffer and skips a conversion on upload.
+        verts = np.asarray(tm.vertices, dtype=np.float32)
+        pv_mesh = pv.PolyData(verts, _cell_array(tm.faces))
 
         colour = "#FF8C1A" if obj.selected else "#6EC6FF"
         actor = self.add_mesh(
@@ -241,6 +250,24 @@ class SLMViewport(QtInteractor):
             reset_camera=False,
         )
         self._mesh_actors[obj.uid] = actor
+        self._mesh_data[obj.uid] = pv_mesh
+
+    def _refresh_actor_points(self, obj: "SceneObject") -> None:
+        """Write *obj*'s current transform into its existing actor in place.
+
+        Used while dragging: the topology is unchanged, so the point buffer
+        VTK already holds is overwritten instead of rebuilding every actor.
+        """
+        pv_mesh = self._mesh_data.get(obj.uid)
+        base = obj.mesh.vertices
+        if pv_mesh is None or pv_mesh.n_points != len(base):
+            self.rebuild_scene()
+            return
+        m = obj.transform.to_matrix()
+        pts = pv_mesh.points
+        pts[:] = base @ m[:3, :3].T
+        pts += m[:3, 3]
+        pv_mesh.Modified()
 
     def highlight_selected(self, uid: Optional[str]) -> None:
         for obj_uid, actor in self._mesh_actors.items():
@@ -324,10 +351,7 @@ class SLMViewport(QtInteractor):
                 self.scene.set_transform(
                     obj.uid, translation=new_trans, record_undo=False
                 )
-                # Re-render actor geometry is tricky slightly efficiently
-                # But here we just rebuild the whole scene or just that actor?
-                # Rebuilding is safest for visual sync.
-                self.rebuild_scene()
+                self._refresh_actor_points(obj)
 
         elif self._current_tool == self.TOOL_ROTATE:
             # Horizontal drag rotates around Z
@@ -343,7 +367,7 @@ class SLMViewport(QtInteractor):
             self.scene.set_transform(
                 obj.uid, rotation_deg=new_rot, record_undo=False
             )
-            self.rebuild_scene()
+            self._refresh_actor_points(obj)
 
         elif self._current_tool == self.TOOL_SCALE:
             # Vertical drag scales
@@ -354,7 +378,7 @@ class SLMViewport(QtInteractor):
             self.scene.set_transform(
                 obj.uid, scale=new_scale, record_undo=False
             )
-            self.rebuild_scene()
+            self._refresh_actor_points(obj)
 
     def _end_drag(self) -> None:
         """Commit the final transform to Undo stack."""
@@ -369,8 +393,8 @@ class SLMViewport(QtInteractor):
             entry = _UndoEntry(
                 obj.uid,
                 self._get_tool_name(),
-                self._drag_initial_transform,
-                obj.transform.clone()
+                self._drag_initial_transform.pack(),
+                obj.transform.pack()
             )
             self.scene.undo_redo.push(entry)
 
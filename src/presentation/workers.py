@@ -1,31 +1,50 @@
 """
 workers.py  --  Threading for Background Tasks
-QThread-based workers to prevent GUI blocking during slicing.
+Thread-pool and QThread-based workers to prevent GUI blocking during
+slicing and export.
 """
 from __future__ import annotations
 
-from typing import TYPE_CHECKING, Dict, Any
+from typing import TYPE_CHECKING, Tuple
 
-from PySide6.QtCore import QObject, QThread, Signal
+from PySide6.QtCore import QMutex, QMutexLocker, QObject, QRunnable, QThread, Signal
 
 if TYPE_CHECKING:
     from src.application.slicer_service import SlicerService
+    from src.infrastructure.repositories.asset_loader import AssetLoader
 
 
-class SlicerWorker(QObject):
+class SlicingSignals(QObject):
     """
-    Worker object for running the slicing operation in a background thread.
-    
+    One-shot completion signals for SlicingRunnable.
+
+    QRunnable is not a QObject, so the signals live on this holder.
+
     Signals:
-    - progress_updated(int, str): Progress percentage (0-100) and message
     - slicing_finished(dict): Emitted when slicing completes successfully
     - slicing_failed(str): Emitted on error with error message
     """
-    
-    progress_updated = Signal(int, str)  # percentage, message
+
     slicing_finished = Signal(dict)  # result dictionary
     slicing_failed = Signal(str)  # error message
-    
+
+
+class SlicingRunnable(QRunnable):
+    """
+    Slicing job for ``QThreadPool``.
+
+    Progress is not signalled per layer: the job records the latest
+    percentage and message under a mutex, and the GUI polls them with
+    ``progress()`` from a timer.  Only completion / failure cross the
+    thread boundary as (queued) signals.
+
+    Usage:
+        job = SlicingRunnable(slicer_service, mesh_items, params)
+        job.signals.slicing_finished.connect(handle_completion)
+        job.signals.slicing_failed.connect(handle_error)
+        QThreadPool.globalInstance().start(job)
+    """
+
     def __init__(
         self,
         slicer_service: SlicerService,
@@ -33,8 +52,8 @@ class SlicerWorker(QObject):
         params: dict,
     ):
         """
-        Initialize the worker.
-        
+        Initialize the job.
+
         Parameters
         ----------
         slicer_service : SlicerService
@@ -45,97 +64,95 @@ class SlicerWorker(QObject):
             Slicing parameters (layer_thickness, laser_power, etc.)
         """
         super().__init__()
-        
+        # The GUI keeps polling the job after run() returns.
+        self.setAutoDelete(False)
+
+        self.signals = SlicingSignals()
         self.slicer_service = slicer_service
         self.mesh_items = mesh_items
         self.params = params
         self._is_cancelled = False
-    
+
+        self._lock = QMutex()
+        self._percentage = 0
+        self._message = ""
+
+    def progress(self) -> Tuple[int, str]:
+        """Latest (percentage, message) reported by the slicer."""
+        with QMutexLocker(self._lock):
+            return self._percentage, self._message
+
     def run(self) -> None:
         """
         Execute the slicing operation.
-        This method is called by QThread when thread starts.
+        This method is called by the thread pool.
         """
         try:
-            # Define progress callback
             def _progress_cb(progress_0_1: float, message: str) -> None:
                 if self._is_cancelled:
                     raise RuntimeError("Slicing cancelled by user")
-                
-                # Convert to percentage
-                percentage = int(progress_0_1 * 100)
-                self.progress_updated.emit(percentage, message)
-            
-            # Run the slicing operation
+                with QMutexLocker(self._lock):
+                    self._percentage = int(progress_0_1 * 100)
+                    self._message = message
+
             result = self.slicer_service.slice(
                 mesh_items=self.mesh_items,
                 params=self.params,
                 progress_cb=_progress_cb,
             )
-            
-            # Emit success
+
             if not self._is_cancelled:
-                self.slicing_finished.emit(result)
-        
+                self.signals.slicing_finished.emit(result)
+
         except Exception as e:
-            # Emit failure
             error_msg = f"Slicing failed: {str(e)}"
-            self.slicing_failed.emit(error_msg)
-    
+            self.signals.slicing_failed.emit(error_msg)
+
     def cancel(self) -> None:
         """Request cancellation of the slicing operation."""
         self._is_cancelled = True
 
 
-class SlicingThread(QThread):
+class MeshLoadSignals(QObject):
     """
-    Convenience QThread subclass for running SlicerWorker.
-    
+    Completion signals for MeshLoadRunnable.
+
+    Signals:
+    - loaded(str, object, str): Display name, trimesh.Trimesh and source path
+    - failed(str): Emitted on error with error message
+    """
+
+    loaded = Signal(str, object, str)  # name, mesh, path
+    failed = Signal(str)  # error message
+
+
+class MeshLoadRunnable(QRunnable):
+    """
+    Parses a mesh file on a ``QThreadPool`` thread.
+
     Usage:
-        thread = SlicingThread(slicer_service, mesh_items, params)
-        thread.worker.progress_updated.connect(update_progress_bar)
-        thread.worker.slicing_finished.connect(handle_completion)
-        thread.worker.slicing_failed.connect(handle_error)
-        thread.start()
+        job = MeshLoadRunnable(asset_loader, path)
+        job.signals.loaded.connect(add_to_scene)
+        job.signals.failed.connect(handle_error)
+        QThreadPool.globalInstance().start(job)
     """
-    
-    def __init__(
-        self,
-        slicer_service: SlicerService,
-        mesh_items: list,
-        params: dict,
-        parent=None,
-    ):
-        """
-        Initialize the thread with a worker.
-        
-        Parameters
-        ----------
-        slicer_service : SlicerService
-            Application-layer slicer service
-        mesh_items : list
-            Meshes to slice
-        params : dict
-            Slicing parameters
-        parent : QObject, optional
-            Parent Qt object
-        """
-        super().__init__(parent)
-        
-        # Create worker
-        self.worker = SlicerWorker(slicer_service, mesh_items, params)
-        
-        # Move worker to this thread
-        self.worker.moveToThread(self)
-        
-        # Connect thread start to worker run
-        self.started.connect(self.worker.run)
-    
-    def cancel(self) -> None:
-        """Cancel the slicing operation and quit the thread."""
-        self.worker.cancel()
-        self.quit()
-        self.wait()
+
+    def __init__(self, asset_loader: AssetLoader, path: str):
+        super().__init__()
+        # Owned by the GUI until the completion slot has run.
+        self.setAutoDelete(False)
+        self.signals = MeshLoadSignals()
+        self.asset_loader = asset_loader
+        self.path = path
+
+    def run(self) -> None:
+        """Load the file and report the result."""
+        try:
+            name, mesh = self.asset_loader.load(self.path)
+        except Exception as e:
+            self.signals.failed.emit(str(e))
+        else:
+            self.signals.loaded.emit(name, mesh, self.path)
 
 
 class ExportWorker(QObject):